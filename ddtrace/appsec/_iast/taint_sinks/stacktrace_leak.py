@@ -16,6 +16,9 @@ from ..constants import VULN_STACKTRACE_LEAK
 from ..taint_sinks._base import VulnerabilityBase
 
 
+_PY_EXT_RE = re.compile(r"\.py$")
+
+
 @oce.register
 class StacktraceLeak(VulnerabilityBase):
     vulnerability_type = VULN_STACKTRACE_LEAK
@@ -107,7 +110,7 @@ def iast_check_stacktrace_leak(content: str) -> None:
         # This is a *best effort* approach (it can be environment-specific).
         module_name = ""
         if module_path:
-            mod_no_ext = re.sub(r"\.py$", "", module_path)
+            mod_no_ext = _PY_EXT_RE.sub("", module_path)
             parts: list[str] = []
             while True:
                 head, tail = os.path.split(mod_no_ext)
@@ -62,26 +62,10 @@ from ddtrace.internal.test_visibility.api import InternalTestSuite
 from ddtrace.internal.test_visibility.coverage_lines import CoverageLines
 from ddtrace.internal.utils.formats import asbool
 from ddtrace.settings.asm import config as asm_config
-from ddtrace.vendor.debtcollector import deprecate
 
 
-if _pytest_version_supports_retries():
-    from ddtrace.contrib.internal.pytest._retry_utils import get_retry_num
-
-if _pytest_version_supports_efd():
-    from ddtrace.contrib.internal.pytest._efd_utils import efd_get_failed_reports
-    from ddtrace.contrib.internal.pytest._efd_utils import efd_get_teststatus
-    from ddtrace.contrib.internal.pytest._efd_utils import efd_handle_retries
-    from ddtrace.contrib.internal.pytest._efd_utils import efd_pytest_terminal_summary_post_yield
-
-if _pytest_version_supports_atr():
-    from ddtrace.contrib.internal.pytest._atr_utils import atr_get_failed_reports
-    from ddtrace.contrib.internal.pytest._atr_utils import atr_get_teststatus
-    from ddtrace.contrib.internal.pytest._atr_utils import atr_handle_retries
-    from ddtrace.contrib.internal.pytest._atr_utils import atr_pytest_terminal_summary_post_yield
-    from ddtrace.contrib.internal.pytest._atr_utils import quarantine_atr_get_teststatus
-    from ddtrace.contrib.internal.pytest._atr_utils import quarantine_pytest_terminal_summary_post_yield
-
+# DEV: the retry/EFD/ATR helpers are imported lazily at their use sites so that plugin load does not pay for
+# submodule imports that are only needed when retries are active
 log = get_logger(__name__)
 
 
@@ -90,6 +74,11 @@ USER_PROPERTY_QUARANTINED = "dd_quarantined"
 OUTCOME_QUARANTINED = "quarantined"
 DISABLED_BY_TEST_MANAGEMENT_REASON = "Flaky test is disabled by Datadog"
 
+# Whether ATR / EFD are active for the current session; cached at session start since the enablement status does not
+# change mid-session and pytest_report_teststatus runs once per phase per test.
+_ATR_ACTIVE = False
+_EFD_ACTIVE = False
+
 
 def _handle_itr_should_skip(item, test_id) -> bool:
     """Checks whether a test should be skipped
@@ -124,6 +113,10 @@ def _handle_test_management(item, test_id):
     is_quarantined = InternalTest.is_quarantined_test(test_id)
     is_disabled = InternalTest.is_disabled_test(test_id)
 
+    # DEV: cache the quarantine status on the item so makereport (which runs once per phase) does not have to query
+    # the service again
+    item._dd_is_quarantined = is_quarantined
+
     if is_quarantined and asbool(os.getenv("_DD_TEST_SKIP_QUARANTINED_TESTS")):
         # For internal use: treat quarantined tests as disabled.
         is_disabled = True
@@ -159,18 +152,43 @@ def _handle_collected_coverage(test_id, coverage_collector) -> None:
         record_code_coverage_empty()
         return
 
-    coverage_data: t.Dict[Path, CoverageLines] = {}
-
-    for path_str, covered_lines in test_covered_lines.items():
-        coverage_data[Path(path_str).absolute()] = covered_lines
+    # DEV: a dict comprehension with the working directory resolved once is noticeably cheaper than calling
+    # Path.absolute() (which re-queries the working directory) for every covered file
+    cwd = os.getcwd()
+    coverage_data: t.Dict[Path, CoverageLines] = {
+        (Path(path_str) if os.path.isabs(path_str) else Path(cwd, path_str)): covered_lines
+        for path_str, covered_lines in test_covered_lines.items()
+    }
 
     InternalTestSuite.add_coverage_data(test_id.parent_id, coverage_data)
 
 
+# Import-time coverage for a module does not change once the module has been imported, so results are memoized
+# across suites (many suites typically cover the same modules).
+_import_coverage_by_path: t.Dict[Path, CoverageLines] = {}
+
+
 def _handle_coverage_dependencies(suite_id) -> None:
     coverage_data = InternalTestSuite.get_coverage_data(suite_id)
     coverage_paths = coverage_data.keys()
-    import_coverage = ModuleCodeCollector.get_import_coverage_for_paths(coverage_paths)
+
+    import_coverage: t.Dict[Path, CoverageLines] = {}
+    uncached_paths = []
+    for path in coverage_paths:
+        covered_lines = _import_coverage_by_path.get(path)
+        if covered_lines is not None:
+            import_coverage[path] = covered_lines
+        else:
+            # DEV: paths without known import-time coverage are re-queried since the module may be imported later in
+            # the session
+            uncached_paths.append(path)
+
+    if uncached_paths:
+        queried_coverage = ModuleCodeCollector.get_import_coverage_for_paths(uncached_paths)
+        if queried_coverage:
+            _import_coverage_by_path.update(queried_coverage)
+            import_coverage.update(queried_coverage)
+
     InternalTestSuite.add_coverage_data(suite_id, import_coverage)
 
 
@@ -207,8 +225,18 @@ def pytest_load_initial_conftests(early_config, parser, args):
         _disable_ci_visibility()
 
 
+# Whether the DD_PYTEST_USE_NEW_PLUGIN_BETA deprecation has been emitted, so that processes that configure pytest
+# multiple times (eg: repeated pytest.main() calls) only warn once.
+_DEPRECATION_WARNED = False
+
+
 def pytest_configure(config: pytest_Config) -> None:
-    if os.getenv("DD_PYTEST_USE_NEW_PLUGIN_BETA"):
+    global _DEPRECATION_WARNED
+
+    if os.getenv("DD_PYTEST_USE_NEW_PLUGIN_BETA") and not _DEPRECATION_WARNED:
+        from ddtrace.vendor.debtcollector import deprecate
+
+        _DEPRECATION_WARNED = True
         # Logging the warning at this point ensures it shows up in output regardless of the use of the -s flag.
         deprecate(
             "the DD_PYTEST_USE_NEW_PLUGIN_BETA environment variable is deprecated",
@@ -269,6 +297,10 @@ def pytest_sessionstart(session: pytest.Session) -> None:
         if InternalTestSession.efd_enabled() and not _pytest_version_supports_efd():
             log.warning("Early Flake Detection disabled: pytest version is not supported")
 
+        global _ATR_ACTIVE, _EFD_ACTIVE
+        _ATR_ACTIVE = _pytest_version_supports_atr() and InternalTestSession.atr_is_enabled()
+        _EFD_ACTIVE = _pytest_version_supports_efd() and InternalTestSession.efd_enabled()
+
     except Exception:  # noqa: E722
         log.debug("encountered error during session start, disabling Datadog CI Visibility", exc_info=True)
         _disable_ci_visibility()
@@ -305,9 +337,11 @@ def _pytest_collection_finish(session) -> None:
 
         InternalTest.discover(test_id, codeowners=item_codeowners, source_file_info=source_file_info)
 
-        markers = [marker.kwargs for marker in item.iter_markers(name="dd_tags")]
-        for tags in markers:
-            InternalTest.set_tags(test_id, tags)
+        merged_tags: t.Dict[str, t.Any] = {}
+        for marker in item.iter_markers(name="dd_tags"):
+            merged_tags.update(marker.kwargs)
+        if merged_tags:
+            InternalTest.set_tags(test_id, merged_tags)
 
         # Pytest markers do not allow us to determine if the test or the suite was marked as unskippable, but any
         # test marked unskippable in a suite makes the entire suite unskippable (since we are in suite skipping
@@ -408,28 +442,38 @@ def pytest_runtest_protocol(item, nextitem) -> None:
 
 
 def _process_result(item, call, result) -> _TestOutcome:
-    test_id = _get_test_id_from_item(item)
+    # DEV: bind frequently used class attributes to locals (LOAD_FAST instead of repeated LOAD_ATTR) since this
+    # function runs up to three times per test
+    set_tag = InternalTest.set_tag
+    get_tag = InternalTest.get_tag
 
     has_exception = call.excinfo is not None
 
-    # In cases where a test was marked as XFAIL, the reason is only available during when call.when == "call", so we
-    # add it as a tag immediately:
-    if getattr(result, "wasxfail", None):
-        InternalTest.set_tag(test_id, XFAIL_REASON, result.wasxfail)
-    elif "xfail" in getattr(result, "keywords", []) and getattr(result, "longrepr", None):
-        InternalTest.set_tag(test_id, XFAIL_REASON, result.longrepr)
-
     # Only capture result if:
     # - there is an exception
     # - the test failed
     # - the test passed with xfail
     # - we are tearing down the test
     # DEV NOTE: some skip scenarios (eg: skipif) have an exception during setup
+    # DEV: this fast path covers the vast majority of setup/call invocations, so it is checked before any xfail
+    # bookkeeping
+    if call.when != "teardown" and not (has_exception or result.failed) and not getattr(result, "wasxfail", None):
+        return _TestOutcome()
+
+    test_id = _get_test_id_from_item(item)
+
+    # In cases where a test was marked as XFAIL, the reason is only available during when call.when == "call", so we
+    # add it as a tag immediately:
+    if getattr(result, "wasxfail", None):
+        set_tag(test_id, XFAIL_REASON, result.wasxfail)
+    elif "xfail" in getattr(result, "keywords", []) and getattr(result, "longrepr", None):
+        set_tag(test_id, XFAIL_REASON, result.longrepr)
+
     if call.when != "teardown" and not (has_exception or result.failed):
         return _TestOutcome()
 
     xfail = hasattr(result, "wasxfail") or "xfail" in result.keywords
-    xfail_reason_tag = InternalTest.get_tag(test_id, XFAIL_REASON) if xfail else None
+    xfail_reason_tag = get_tag(test_id, XFAIL_REASON) if xfail else None
     has_skip_keyword = any(x in result.keywords for x in ["skip", "skipif", "skipped"])
 
     # If run with --runxfail flag, tests behave as if they were not marked with xfail,
@@ -442,9 +486,9 @@ def _process_result(item, call, result) -> _TestOutcome:
         if xfail and not has_skip_keyword:
             # XFail tests that fail are recorded skipped by pytest, should be passed instead
             if not item.config.option.runxfail:
-                InternalTest.set_tag(test_id, test.RESULT, test.Status.XFAIL.value)
+                set_tag(test_id, test.RESULT, test.Status.XFAIL.value)
                 if xfail_reason_tag is None:
-                    InternalTest.set_tag(test_id, XFAIL_REASON, getattr(result, "wasxfail", "XFail"))
+                    set_tag(test_id, XFAIL_REASON, getattr(result, "wasxfail", "XFail"))
                 return _TestOutcome(TestStatus.PASS)
 
         return _TestOutcome(TestStatus.SKIP, _extract_reason(call))
@@ -453,16 +497,16 @@ def _process_result(item, call, result) -> _TestOutcome:
         if xfail and not has_skip_keyword and not item.config.option.runxfail:
             # XPass (strict=False) are recorded passed by pytest
             if xfail_reason_tag is None:
-                InternalTest.set_tag(test_id, XFAIL_REASON, "XFail")
-            InternalTest.set_tag(test_id, test.RESULT, test.Status.XPASS.value)
+                set_tag(test_id, XFAIL_REASON, "XFail")
+            set_tag(test_id, test.RESULT, test.Status.XPASS.value)
 
         return _TestOutcome(TestStatus.PASS)
 
     if xfail and not has_skip_keyword and not item.config.option.runxfail:
         # XPass (strict=True) are recorded failed by pytest, longrepr contains reason
         if xfail_reason_tag is None:
-            InternalTest.set_tag(test_id, XFAIL_REASON, getattr(result, "longrepr", "XFail"))
-        InternalTest.set_tag(test_id, test.RESULT, test.Status.XPASS.value)
+            set_tag(test_id, XFAIL_REASON, getattr(result, "longrepr", "XFail"))
+        set_tag(test_id, test.RESULT, test.Status.XPASS.value)
         return _TestOutcome(TestStatus.FAIL)
 
     # NOTE: for ATR and EFD purposes, we need to know if the test failed during setup or teardown.
@@ -478,14 +522,19 @@ def _process_result(item, call, result) -> _TestOutcome:
 
 def _pytest_runtest_makereport(item: pytest.Item, call: pytest_CallInfo, outcome: pytest_TestReport) -> None:
     # When ATR or EFD retries are active, we do not want makereport to generate results
-    if _pytest_version_supports_retries() and get_retry_num(item.nodeid) is not None:
-        return
+    if _pytest_version_supports_retries():
+        from ddtrace.contrib.internal.pytest._retry_utils import get_retry_num
+
+        if get_retry_num(item.nodeid) is not None:
+            return
 
     original_result = outcome.get_result()
 
     test_id = _get_test_id_from_item(item)
 
-    is_quarantined = InternalTest.is_quarantined_test(test_id)
+    is_quarantined = getattr(item, "_dd_is_quarantined", None)
+    if is_quarantined is None:
+        is_quarantined = InternalTest.is_quarantined_test(test_id)
 
     test_outcome = _process_result(item, call, original_result)
 
@@ -513,8 +562,12 @@ def _pytest_runtest_makereport(item: pytest.Item, call: pytest_CallInfo, outcome
         log.debug("Test %s failed during setup or teardown, skipping retries", test_id)
         return
     if InternalTestSession.efd_enabled() and InternalTest.efd_should_retry(test_id):
+        from ddtrace.contrib.internal.pytest._efd_utils import efd_handle_retries
+
         return efd_handle_retries(test_id, item, call.when, original_result, test_outcome)
     if InternalTestSession.atr_is_enabled() and InternalTest.atr_should_retry(test_id):
+        from ddtrace.contrib.internal.pytest._atr_utils import atr_handle_retries
+
         return atr_handle_retries(test_id, item, call.when, original_result, test_outcome, is_quarantined)
 
 
@@ -540,11 +593,15 @@ def _pytest_terminal_summary_pre_yield(terminalreporter) -> int:
     failed_reports_initial_size = len(terminalreporter.stats.get(PYTEST_STATUS.FAILED, []))
 
     if _pytest_version_supports_efd() and InternalTestSession.efd_enabled():
+        from ddtrace.contrib.internal.pytest._efd_utils import efd_get_failed_reports
+
         for failed_report in efd_get_failed_reports(terminalreporter):
             failed_report.outcome = PYTEST_STATUS.FAILED
             terminalreporter.stats.setdefault("failed", []).append(failed_report)
 
     if _pytest_version_supports_atr() and InternalTestSession.atr_is_enabled():
+        from ddtrace.contrib.internal.pytest._atr_utils import atr_get_failed_reports
+
         for failed_report in atr_get_failed_reports(terminalreporter):
             failed_report.outcome = PYTEST_STATUS.FAILED
             terminalreporter.stats.setdefault("failed", []).append(failed_report)
@@ -569,12 +626,18 @@ def _pytest_terminal_summary_post_yield(terminalreporter, failed_reports_initial
 
     # IMPORTANT: terminal summary functions mutate terminalreporter.stats
     if _pytest_version_supports_efd() and InternalTestSession.efd_enabled():
+        from ddtrace.contrib.internal.pytest._efd_utils import efd_pytest_terminal_summary_post_yield
+
         efd_pytest_terminal_summary_post_yield(terminalreporter)
 
-    if _pytest_version_supports_atr() and InternalTestSession.atr_is_enabled():
-        atr_pytest_terminal_summary_post_yield(terminalreporter)
+    if _pytest_version_supports_atr():
+        from ddtrace.contrib.internal.pytest._atr_utils import atr_pytest_terminal_summary_post_yield
+        from ddtrace.contrib.internal.pytest._atr_utils import quarantine_pytest_terminal_summary_post_yield
 
-    quarantine_pytest_terminal_summary_post_yield(terminalreporter)
+        if InternalTestSession.atr_is_enabled():
+            atr_pytest_terminal_summary_post_yield(terminalreporter)
+
+        quarantine_pytest_terminal_summary_post_yield(terminalreporter)
 
     return
 
@@ -653,19 +716,23 @@ def pytest_report_teststatus(
     if not is_test_visibility_enabled():
         return
 
-    if _pytest_version_supports_atr() and InternalTestSession.atr_is_enabled():
+    if _ATR_ACTIVE:
+        from ddtrace.contrib.internal.pytest._atr_utils import atr_get_teststatus
+        from ddtrace.contrib.internal.pytest._atr_utils import quarantine_atr_get_teststatus
+
         test_status = atr_get_teststatus(report) or quarantine_atr_get_teststatus(report)
         if test_status is not None:
             return test_status
 
-    if _pytest_version_supports_efd() and InternalTestSession.efd_enabled():
+    if _EFD_ACTIVE:
+        from ddtrace.contrib.internal.pytest._efd_utils import efd_get_teststatus
+
         test_status = efd_get_teststatus(report)
         if test_status is not None:
             return test_status
 
-    user_properties = getattr(report, "user_properties", [])
-    is_quarantined = (USER_PROPERTY_QUARANTINED, True) in user_properties
-    if is_quarantined:
+    user_properties = getattr(report, "user_properties", None)
+    if user_properties and (USER_PROPERTY_QUARANTINED, True) in user_properties:
         if report.when == "teardown":
             return (OUTCOME_QUARANTINED, "q", ("QUARANTINED", {"blue": True}))
         else:
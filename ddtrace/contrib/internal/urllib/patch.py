@@ -15,12 +15,15 @@ def patch():
     """patch the built-in urllib.request methods for tracing"""
     if getattr(urllib.request, "__datadog_patch", False):
         return
-    urllib.request.__datadog_patch = True
 
     if asm_config._load_modules:
         from ddtrace.appsec._common_module_patches import wrapped_request_D8CB81E472AF98A2 as _wrap_open
 
         _w("urllib.request", "urlopen", _wrap_open)
+        # DEV: only mark the module as patched when the wrapper is actually
+        # installed, so that unpatch remains symmetric and urlopen keeps its
+        # unproxied fast path when neither IAST nor exploit prevention is on
+        urllib.request.__datadog_patch = True
 
     if asm_config._iast_enabled:
         from ddtrace.appsec._iast._metrics import _set_metric_iast_instrumented_sink
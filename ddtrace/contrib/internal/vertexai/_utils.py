@@ -22,6 +22,43 @@ class BaseTracedVertexAIStreamResponse:
         self.is_chat = is_chat
         self._chunks = []
         self._history = history
+        # DEV: when neither the APM span content nor LLM Observability will consume the chunk contents, we avoid
+        # retaining chunks and only accumulate the light-weight finish reason / role / usage info as the stream
+        # goes by
+        self._need_content = integration.is_pc_sampled_span(span) or integration.is_pc_sampled_llmobs(span)
+        self._finish_reasons = {}
+        self._role = ""
+        self._usage = None
+
+    def _on_chunk(self, chunk):
+        if self._need_content:
+            # only keep track of the first chunk for chat messages since
+            # it is modified during the streaming process
+            if not self.is_chat or not self._chunks:
+                self._chunks.append(chunk)
+            return
+        for candidate_idx, candidate in enumerate(_get_attr(chunk, "candidates", [])):
+            finish_reason = _get_attr(candidate, "finish_reason", None)
+            if finish_reason:
+                self._finish_reasons[candidate_idx] = _get_attr(finish_reason, "name", "")
+            if not self._role:
+                self._role = _get_attr(_get_attr(candidate, "content", {}), "role", "")
+        token_counts = _get_attr(chunk, "usage_metadata", None)
+        if token_counts:
+            self._usage = token_counts
+
+    def _finish_stream(self):
+        if self._need_content:
+            tag_stream_response(self._dd_span, self._chunks, self._dd_integration)
+            if self._dd_integration.is_pc_sampled_llmobs(self._dd_span):
+                self._kwargs["instance"] = self._model_instance
+                self._kwargs["history"] = self._history
+                self._dd_integration.llmobs_set_tags(
+                    self._dd_span, args=self._args, kwargs=self._kwargs, response=self._chunks
+                )
+        else:
+            tag_stream_usage(self._dd_span, self._dd_integration, self._finish_reasons, self._role, self._usage)
+        self._dd_span.finish()
 
 
 class TracedVertexAIStreamResponse(BaseTracedVertexAIStreamResponse):
@@ -35,23 +72,13 @@ class TracedVertexAIStreamResponse(BaseTracedVertexAIStreamResponse):
     def __iter__(self):
         try:
             for chunk in self._generator.__iter__():
-                # only keep track of the first chunk for chat messages since
-                # it is modified during the streaming process
-                if not self.is_chat or not self._chunks:
-                    self._chunks.append(chunk)
+                self._on_chunk(chunk)
                 yield chunk
         except Exception:
             self._dd_span.set_exc_info(*sys.exc_info())
             raise
         finally:
-            tag_stream_response(self._dd_span, self._chunks, self._dd_integration)
-            if self._dd_integration.is_pc_sampled_llmobs(self._dd_span):
-                self._kwargs["instance"] = self._model_instance
-                self._kwargs["history"] = self._history
-                self._dd_integration.llmobs_set_tags(
-                    self._dd_span, args=self._args, kwargs=self._kwargs, response=self._chunks
-                )
-            self._dd_span.finish()
+            self._finish_stream()
 
 
 class TracedAsyncVertexAIStreamResponse(BaseTracedVertexAIStreamResponse):
@@ -65,84 +92,93 @@ class TracedAsyncVertexAIStreamResponse(BaseTracedVertexAIStreamResponse):
     async def __aiter__(self):
         try:
             async for chunk in self._generator.__aiter__():
-                # only keep track of the first chunk for chat messages since
-                # it is modified during the streaming process
-                if not self.is_chat or not self._chunks:
-                    self._chunks.append(chunk)
+                self._on_chunk(chunk)
                 yield chunk
         except Exception:
             self._dd_span.set_exc_info(*sys.exc_info())
             raise
         finally:
-            tag_stream_response(self._dd_span, self._chunks, self._dd_integration)
-            if self._dd_integration.is_pc_sampled_llmobs(self._dd_span):
-                self._kwargs["instance"] = self._model_instance
-                self._kwargs["history"] = self._history
-                self._dd_integration.llmobs_set_tags(
-                    self._dd_span, args=self._args, kwargs=self._kwargs, response=self._chunks
-                )
-            self._dd_span.finish()
+            self._finish_stream()
 
 
 def extract_info_from_parts(parts):
     """Return concatenated text from parts and function calls."""
-    concatenated_text = ""
+    # DEV: collect the text fragments and join once to avoid quadratic string concatenation on long streams
+    text_parts = []
     function_calls = []
     for part in parts:
         text = _get_attr(part, "text", "")
-        concatenated_text += text
+        if text:
+            text_parts.append(text)
         function_call = _get_attr(part, "function_call", None)
         if function_call is not None:
             function_calls.append(function_call)
-    return concatenated_text, function_calls
+    return "".join(text_parts), function_calls
+
+
+# streamed responses only ever tag the first candidate/part, so the key prefix is a constant
+_RESPONSE_PART_PREFIX = "vertexai.response.candidates.0.content.parts.0"
 
 
-def _tag_response_parts(span, integration, parts):
+def _tag_response_parts(integration, parts, tags):
     text, function_calls = extract_info_from_parts(parts)
-    span.set_tag_str(
-        "vertexai.response.candidates.%d.content.parts.%d.text" % (0, 0),
-        integration.trunc(str(text)),
-    )
+    tags[f"{_RESPONSE_PART_PREFIX}.text"] = integration.trunc(str(text))
     for idx, function_call in enumerate(function_calls):
-        span.set_tag_str(
-            "vertexai.response.candidates.%d.content.parts.%d.function_calls.%d.function_call.name" % (0, 0, idx),
-            _get_attr(function_call, "name", ""),
-        )
-        span.set_tag_str(
-            "vertexai.response.candidates.%d.content.parts.%d.function_calls.%d.function_call.args" % (0, 0, idx),
-            integration.trunc(str(_get_attr(function_call, "args", ""))),
+        tags[f"{_RESPONSE_PART_PREFIX}.function_calls.{idx}.function_call.name"] = _get_attr(function_call, "name", "")
+        tags[f"{_RESPONSE_PART_PREFIX}.function_calls.{idx}.function_call.args"] = integration.trunc(
+            str(_get_attr(function_call, "args", ""))
         )
 
 
 def tag_stream_response(span, chunks, integration):
     all_parts = []
     role = ""
+    # DEV: accumulate tags and metrics locally and flush them with a single bulk update per span
+    tags = {}
+    metrics = {}
+    is_sampled = integration.is_pc_sampled_span(span)
+    get_attr = _get_attr
     for chunk in chunks:
-        candidates = _get_attr(chunk, "candidates", [])
+        candidates = get_attr(chunk, "candidates", [])
         for candidate_idx, candidate in enumerate(candidates):
-            finish_reason = _get_attr(candidate, "finish_reason", None)
+            finish_reason = get_attr(candidate, "finish_reason", None)
             if finish_reason:
-                span.set_tag_str(
-                    "vertexai.response.candidates.%d.finish_reason" % (candidate_idx),
-                    _get_attr(finish_reason, "name", ""),
-                )
-            candidate_content = _get_attr(candidate, "content", {})
-            role = role or _get_attr(candidate_content, "role", "")
-            if not integration.is_pc_sampled_span(span):
+                tags[f"vertexai.response.candidates.{candidate_idx}.finish_reason"] = get_attr(finish_reason, "name", "")
+            candidate_content = get_attr(candidate, "content", {})
+            role = role or get_attr(candidate_content, "role", "")
+            if not is_sampled:
                 continue
-            parts = _get_attr(candidate_content, "parts", [])
+            parts = get_attr(candidate_content, "parts", [])
             all_parts.extend(parts)
-        token_counts = _get_attr(chunk, "usage_metadata", None)
+        token_counts = get_attr(chunk, "usage_metadata", None)
         if not token_counts:
             continue
-        span.set_metric("vertexai.response.usage.prompt_tokens", _get_attr(token_counts, "prompt_token_count", 0))
-        span.set_metric(
-            "vertexai.response.usage.completion_tokens", _get_attr(token_counts, "candidates_token_count", 0)
-        )
-        span.set_metric("vertexai.response.usage.total_tokens", _get_attr(token_counts, "total_token_count", 0))
+        metrics["vertexai.response.usage.prompt_tokens"] = get_attr(token_counts, "prompt_token_count", 0)
+        metrics["vertexai.response.usage.completion_tokens"] = get_attr(token_counts, "candidates_token_count", 0)
+        metrics["vertexai.response.usage.total_tokens"] = get_attr(token_counts, "total_token_count", 0)
+    # streamed responses have only a single candidate, so there is only one role to be tagged
+    tags["vertexai.response.candidates.0.content.role"] = str(role)
+    _tag_response_parts(integration, all_parts, tags)
+    span.set_tags(tags)
+    span.set_metrics(metrics)
+
+
+def tag_stream_usage(span, integration, finish_reasons, role, token_counts):
+    """Tag the stream info accumulated for spans whose content is not sampled.
+
+    This produces the same tags as ``tag_stream_response`` does for unsampled spans, without requiring the chunks to
+    be retained.
+    """
+    for candidate_idx, finish_reason in finish_reasons.items():
+        span.set_tag_str("vertexai.response.candidates.%d.finish_reason" % (candidate_idx), finish_reason)
     # streamed responses have only a single candidate, so there is only one role to be tagged
     span.set_tag_str("vertexai.response.candidates.0.content.role", str(role))
-    _tag_response_parts(span, integration, all_parts)
+    span.set_tag_str("vertexai.response.candidates.0.content.parts.0.text", integration.trunc(""))
+    if not token_counts:
+        return
+    span.set_metric("vertexai.response.usage.prompt_tokens", _get_attr(token_counts, "prompt_token_count", 0))
+    span.set_metric("vertexai.response.usage.completion_tokens", _get_attr(token_counts, "candidates_token_count", 0))
+    span.set_metric("vertexai.response.usage.total_tokens", _get_attr(token_counts, "total_token_count", 0))
 
 
 def _tag_request_content(span, integration, content, content_idx):
@@ -181,13 +217,6 @@ def tag_request(span, integration, instance, args, kwargs, is_chat):
     """
     # instance is either a chat session or a model itself
     model_instance = instance if isinstance(instance, GenerativeModel) else instance._model
-    contents = get_argument_value(args, kwargs, 0, "content" if is_chat else "contents")
-    history = _get_attr(instance, "_history", [])
-    if history:
-        if isinstance(contents, list):
-            contents = history + contents
-        if isinstance(contents, Part) or isinstance(contents, str) or isinstance(contents, dict):
-            contents = history + [contents]
     generation_config = get_generation_config_google(model_instance, kwargs)
     generation_config_dict = None
     if generation_config is not None:
@@ -197,26 +226,40 @@ def tag_request(span, integration, instance, args, kwargs, is_chat):
     system_instructions = get_system_instructions_from_google_model(model_instance)
     stream = kwargs.get("stream", None)
 
+    # DEV: accumulate tags locally and flush them with a single bulk update per span
+    tags = {}
     if generation_config_dict is not None:
         for k, v in generation_config_dict.items():
-            span.set_tag_str("vertexai.request.generation_config.%s" % k, str(v))
+            tags["vertexai.request.generation_config.%s" % k] = str(v)
 
     if stream:
-        span.set_tag("vertexai.request.stream", True)
+        tags["vertexai.request.stream"] = True
 
     if not integration.is_pc_sampled_span(span):
+        span.set_tags(tags)
         return
 
+    # DEV: the request contents (including a copy of potentially long chat histories) are only materialized for
+    # sampled spans
+    contents = get_argument_value(args, kwargs, 0, "content" if is_chat else "contents")
+    history = _get_attr(instance, "_history", [])
+    if history:
+        if isinstance(contents, list):
+            contents = history + contents
+        if isinstance(contents, Part) or isinstance(contents, str) or isinstance(contents, dict):
+            contents = history + [contents]
+
     for idx, text in enumerate(system_instructions):
-        span.set_tag_str(
-            "vertexai.request.system_instruction.%d.text" % idx,
-            integration.trunc(str(text)),
-        )
+        tags["vertexai.request.system_instruction.%d.text" % idx] = integration.trunc(str(text))
 
     if isinstance(contents, str):
-        span.set_tag_str("vertexai.request.contents.0.text", integration.trunc(str(contents)))
+        tags["vertexai.request.contents.0.text"] = integration.trunc(str(contents))
+        span.set_tags(tags)
         return
-    elif isinstance(contents, Part):
+
+    span.set_tags(tags)
+
+    if isinstance(contents, Part):
         tag_request_content_part_google("vertexai", span, integration, contents, 0, 0)
         return
     elif not isinstance(contents, list):
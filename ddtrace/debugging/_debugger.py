@@ -2,6 +2,7 @@ from collections import defaultdict
 from collections import deque
 from itertools import chain
 import linecache
+import logging
 import os
 from pathlib import Path
 import sys
@@ -375,7 +376,10 @@ class Debugger(Service):
             if signal.state is SignalState.DONE:
                 self._probe_registry.set_emitting(probe)
 
-            log.debug("[%s][P: %s] Debugger. Report signal %s", os.getpid(), os.getppid(), signal)
+            # DEV: os.getpid/os.getppid are syscalls so we only pay for them
+            # when debug logging is actually enabled
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[%s][P: %s] Debugger. Report signal %s", os.getpid(), os.getppid(), signal)
             self.__uploader__.get_collector().push(signal)
 
         except Exception:
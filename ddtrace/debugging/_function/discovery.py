@@ -1,6 +1,5 @@
 from collections import defaultdict
 from collections import deque
-from pathlib import Path
 
 from wrapt import FunctionWrapper
 
@@ -32,6 +31,7 @@ from ddtrace.internal.safety import _isinstance
 from ddtrace.internal.utils.inspection import collect_code_objects
 from ddtrace.internal.utils.inspection import functions_for_code
 from ddtrace.internal.utils.inspection import linenos
+from ddtrace.internal.utils.inspection import resolved_path
 
 
 log = get_logger(__name__)
@@ -42,6 +42,8 @@ ContainerKey = Union[str, int, Type[staticmethod], Type[classmethod]]
 
 CONTAINER_TYPES = (type, property, classmethod, staticmethod)
 
+_PROPERTY_MEMBERS: Tuple[Tuple[str, str], ...] = (("getter", "fget"), ("setter", "fset"), ("deleter", "fdel"))
+
 
 class FullyNamed(Protocol):
     """A fully named object."""
@@ -82,9 +84,7 @@ class ContainerIterator(Iterator, FullyNamedFunction):
             self.__name__ = "<locals>"
 
         elif isinstance(container, property):
-            self._iter = iter(
-                (m, getattr(container, a)) for m, a in {("getter", "fget"), ("setter", "fset"), ("deleter", "fdel")}
-            )
+            self._iter = iter((m, getattr(container, a)) for m, a in _PROPERTY_MEMBERS)
             assert container.fget is not None  # nosec
             self.__name__ = container.fget.__name__
 
@@ -179,6 +179,9 @@ def _collect_functions(module: ModuleType) -> Dict[str, _FunctionCodePair]:
     containers = deque([ContainerIterator(module)])
     functions = {}
     seen_containers = set()
+    # DEV: functions are tracked by id(), matching seen_containers, to avoid
+    # hashing and holding strong references to transient decorator wrappers;
+    # the walked objects stay alive through the module object graph.
     seen_functions = set()
 
     while containers:
@@ -188,27 +191,35 @@ def _collect_functions(module: ModuleType) -> Dict[str, _FunctionCodePair]:
             continue
         seen_containers.add(id(c._container))
 
+        # DEV: the container full name is invariant for the whole iteration so
+        # the name prefix is computed once
+        prefix = c.__fullname__ + "." if c.__fullname__ else ""
+
         for k, o in c:
             code = getattr(o, "__code__", None) if _isinstance(o, (FunctionType, FunctionWrapper)) else None
             if code is not None:
                 f = cast(FunctionType, o)
                 local_name = _local_name(k, o) if isinstance(k, str) else o.__name__
 
-                if o not in seen_functions:
-                    seen_functions.add(o)
+                if id(o) not in seen_functions:
+                    seen_functions.add(id(o))
                     o = cast(FullyNamedFunction, o)
-                    o.__fullname__ = ".".join((c.__fullname__, local_name)) if c.__fullname__ else local_name
+                    o.__fullname__ = prefix + local_name
 
-                for name in (k, local_name) if isinstance(k, str) and k != local_name else (local_name,):
-                    fullname = ".".join((c.__fullname__, name)) if c.__fullname__ else name
-                    if fullname not in functions or Path(code.co_filename).resolve() == path:
+                key_is_str = isinstance(k, str)
+                if key_is_str:
+                    fullname = prefix + k
+                    if fullname not in functions or resolved_path(code.co_filename) == path:
                         # Give precedence to code objects from the module and
                         # try to retrieve any potentially decorated function so
                         # that we don't end up returning the decorator function
                         # instead of the original function.
-                        functions[fullname] = _FunctionCodePair(
-                            function=cast(FunctionType, undecorated(f, name, path) if name == k else o)
-                        )
+                        functions[fullname] = _FunctionCodePair(function=cast(FunctionType, undecorated(f, k, path)))
+
+                if not key_is_str or k != local_name:
+                    fullname = prefix + local_name
+                    if fullname not in functions or resolved_path(code.co_filename) == path:
+                        functions[fullname] = _FunctionCodePair(function=cast(FunctionType, o))
 
                 try:
                     if f.__closure__:
@@ -238,6 +249,8 @@ class FunctionDiscovery(defaultdict):
     def __init__(self, module: ModuleType) -> None:
         super().__init__(list)
 
+        self._lineno_index_built = True
+
         module_path = origin(module)
         if module_path is None:
             # We are not going to collect anything because no code objects will
@@ -245,15 +258,23 @@ class FunctionDiscovery(defaultdict):
             return
 
         self._module = module
+        self._module_path = module_path
         self._fullname_index = _collect_functions(module)
         if PYTHON_VERSION_INFO < (3, 11):
             self._name_index: Dict[str, List[_FunctionCodePair]] = defaultdict(list)
         self._cached: Dict[int, List[FullyNamedFunction]] = {}
 
-        # Create the line to function mapping
+        # DEV: The line to function mapping is built lazily on the first
+        # at_line call since name-based lookups do not need it and the
+        # linenos() bytecode walk is comparatively expensive.
+        self._lineno_index_built = False
+        self._module_code_pairs: Optional[List[Tuple[CodeType, _FunctionCodePair]]] = None
+
         if hasattr(module, "__dd_code__"):
+            self._module_code_pairs = []
             for code in module.__dd_code__:
                 fcp = _FunctionCodePair(code=code)
+                self._module_code_pairs.append((code, fcp))
 
                 if PYTHON_VERSION_INFO >= (3, 11):
                     # From this version of Python we can derive the qualified
@@ -263,8 +284,20 @@ class FunctionDiscovery(defaultdict):
                 else:
                     self._name_index[code.co_name].append(fcp)
 
+    def _build_lineno_index(self) -> None:
+        if self._lineno_index_built:
+            return
+        self._lineno_index_built = True
+
+        # Create the line to function mapping
+        # DEV: the buckets are populated in a local plain dict (setdefault is a
+        # single C call, unlike defaultdict.__missing__) and merged in one shot
+        buckets: Dict[int, List[_FunctionCodePair]] = {}
+        if self._module_code_pairs is not None:
+            for code, fcp in self._module_code_pairs:
                 for lineno in linenos(code):
-                    self[lineno].append(fcp)
+                    buckets.setdefault(lineno, []).append(fcp)
+            self._module_code_pairs = None
         else:
             # If the module was already loaded we don't have its code object
             seen_functions = set()
@@ -276,13 +309,14 @@ class FunctionDiscovery(defaultdict):
 
                 if (
                     function not in seen_functions
-                    and Path(cast(FunctionType, function).__code__.co_filename).resolve() == module_path
+                    and resolved_path(cast(FunctionType, function).__code__.co_filename) == self._module_path
                 ):
                     # We only map line numbers for functions that actually belong to
                     # the module.
                     for lineno in linenos(cast(FunctionType, function)):
-                        self[lineno].append(_FunctionCodePair(function=cast(FunctionType, function)))
+                        buckets.setdefault(lineno, []).append(_FunctionCodePair(function=cast(FunctionType, function)))
                 seen_functions.add(function)
+        self.update(buckets)
 
     def at_line(self, line: int) -> List[FullyNamedFunction]:
         """Get the functions at the given line.
@@ -290,6 +324,8 @@ class FunctionDiscovery(defaultdict):
         Note that, in general, there can be multiple copies of the same
         functions. This can happen as a result, e.g., of using decorators.
         """
+        self._build_lineno_index()
+
         if line in self._cached:
             return self._cached[line]
 
@@ -310,6 +346,10 @@ class FunctionDiscovery(defaultdict):
 
         return []
 
+    def keys(self):
+        self._build_lineno_index()
+        return super().keys()
+
     def by_name(self, qualname: str) -> FullyNamedFunction:
         """Get the function by its qualified name."""
         fullname = f"{self._module.__name__}.{qualname}"
@@ -353,13 +393,20 @@ class FunctionDiscovery(defaultdict):
         """
         # Cache the function tree on the module
         try:
-            return module.__function_discovery__
+            fd = module.__function_discovery__
+            if not hasattr(module, "__dd_code__"):
+                return fd
+            # DEV: a module that carries fresh code objects after discovery was
+            # cached has been re-executed (e.g. importlib.reload), so the
+            # cached information is stale and must be rebuilt.
         except AttributeError:
-            fd = module.__function_discovery__ = cls(module)  # type: ignore[attr-defined]
-            if hasattr(module, "__dd_code__"):
-                # We no longer need to keep this collection around
-                del module.__dd_code__
-            return fd
+            pass
+
+        fd = module.__function_discovery__ = cls(module)  # type: ignore[attr-defined]
+        if hasattr(module, "__dd_code__"):
+            # We no longer need to keep this collection around
+            del module.__dd_code__
+        return fd
 
     @classmethod
     def transformer(cls, code: CodeType, module: ModuleType) -> CodeType:
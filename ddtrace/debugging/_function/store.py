@@ -2,11 +2,11 @@ from types import CodeType
 from types import FunctionType
 from typing import Any
 from typing import Callable
-from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
 from typing import cast
+from weakref import WeakKeyDictionary
 
 from ddtrace.debugging._function.discovery import FullyNamed
 from ddtrace.internal.bytecode_injection import HookInfoType
@@ -38,11 +38,12 @@ class FunctionStore(object):
     """
 
     def __init__(self, extra_attrs: Optional[List[str]] = None) -> None:
-        self._code_map: Dict[FunctionType, CodeType] = {}
-        self._wrapper_map: Dict[FunctionType, WrappingContext] = {}
-        self._extra_attrs = ["__dd_context_wrapped__"]
-        if extra_attrs:
-            self._extra_attrs.extend(extra_attrs)
+        # DEV: weak keys so that the store does not keep patched functions
+        # (and hence their modules) alive for its whole lifetime; collected
+        # functions no longer need restoring.
+        self._code_map: "WeakKeyDictionary[FunctionType, CodeType]" = WeakKeyDictionary()
+        self._wrapper_map: "WeakKeyDictionary[FunctionType, WrappingContext]" = WeakKeyDictionary()
+        self._extra_attrs = ("__dd_context_wrapped__", *(extra_attrs or ()))
 
     def __enter__(self):
         return self
@@ -59,10 +60,10 @@ class FunctionStore(object):
 
         Returns the set of probe IDs for those probes that failed to inject.
         """
-        try:
-            f = cast(FunctionType, cast(FullyNamedContextWrappedFunction, function.__dd_context_wrapped__.__wrapped__))  # type: ignore[union-attr]
-        except AttributeError:
-            f = cast(FunctionType, function)
+        # DEV: getattr with a default avoids the exception machinery on the
+        # common case of an unwrapped function
+        context = getattr(function, "__dd_context_wrapped__", None)
+        f = cast(FunctionType, function if context is None else context.__wrapped__)
         self._store(f)
         return {p.probe_id for _, _, p in inject_hooks(f, hooks)}
 
@@ -71,11 +72,10 @@ class FunctionStore(object):
 
         Returns the set of probe IDs for those probes that failed to eject.
         """
-        try:
-            f = cast(FullyNamedContextWrappedFunction, function).__dd_context_wrapped__.__wrapped__  # type: ignore[union-attr]
-        except AttributeError:
-            # Not a wrapped function so we can actually eject from it
-            f = function
+        # Not a wrapped function if the context is missing, so we can eject
+        # from it directly
+        context = getattr(function, "__dd_context_wrapped__", None)
+        f = function if context is None else context.__wrapped__
 
         return {p.probe_id for _, _, p in eject_hooks(cast(FunctionType, f), hooks)}
 
@@ -99,10 +99,13 @@ class FunctionStore(object):
 
     def restore_all(self) -> None:
         """Restore all the patched functions to their original form."""
-        for function, code in self._code_map.items():
+        extra_attrs = self._extra_attrs
+        # DEV: snapshot the items to guard against entries dropping out while
+        # we restore
+        for function, code in list(self._code_map.items()):
             function.__code__ = code
-            for attr in self._extra_attrs:
-                try:
-                    delattr(function, attr)
-                except AttributeError:
-                    pass
+            # DEV: pop with a default instead of delattr to avoid paying for
+            # an AttributeError on every unset attribute
+            function_dict = function.__dict__
+            for attr in extra_attrs:
+                function_dict.pop(attr, None)
@@ -70,6 +70,13 @@ DEFAULT_CAPTURE_LIMITS = CaptureLimits()
 class Probe(abc.ABC):
     __context_creator__ = False
 
+    # Probe traits, set by the mixins below on initialization. The signal hot
+    # path tests these plain attributes instead of running isinstance checks
+    # against the mixin classes on every probe firing.
+    __has_timing__ = False
+    __has_condition__ = False
+    __has_rate_limit__ = False
+
     probe_id: str
     version: int
     tags: Dict[str, Any] = field(compare=False)
@@ -105,6 +112,7 @@ class RateLimitMixin(AbstractProbeMixIn):
 
     def __post_init__(self):
         super().__post_init__()
+        self.__has_rate_limit__ = True
         self.limiter = RateLimiter(
             limit_rate=self.rate,
             tau=1.0 / self.rate if self.rate else 1.0,
@@ -128,6 +136,7 @@ class ProbeConditionMixin(AbstractProbeMixIn):
 
     def __post_init__(self):
         super().__post_init__()
+        self.__has_condition__ = True
         self.condition_error_limiter = RateLimiter(
             limit_rate=self.condition_error_rate,
             tau=1.0 / self.condition_error_rate if self.condition_error_rate else 1.0,
@@ -179,6 +188,10 @@ class FunctionLocationMixin(ProbeLocationMixin):
 class TimingMixin(AbstractProbeMixIn):
     evaluate_at: ProbeEvalTiming
 
+    def __post_init__(self):
+        super().__post_init__()
+        self.__has_timing__ = True
+
 
 class MetricProbeKind(str, Enum):
     COUNTER = "COUNT"
@@ -282,6 +295,14 @@ class SpanDecorationTargetSpan(str, Enum):
 class SpanDecorationTag:
     name: str
     value: StringTemplate
+    # Derived tag names, precomputed once so that the per-hit decoration path
+    # does not re-format them.
+    error_tag_name: str = field(init=False, repr=False, compare=False)
+    probe_id_tag_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.error_tag_name = "_dd.di.%s.evaluation_error" % self.name
+        self.probe_id_tag_name = "_dd.di.%s.probe_id" % self.name
 
 
 @dataclass
@@ -5,6 +5,8 @@ from types import FrameType
 from typing import Any
 from typing import Dict
 from typing import Iterator
+from typing import Mapping
+from typing import Optional
 from typing import Tuple
 
 from ddtrace.internal.safety import get_slots
@@ -22,6 +24,40 @@ def get_args(frame: FrameType) -> Iterator[Tuple[str, Any]]:
     return zip(arg_names, arg_values)
 
 
+class FrameArgsView(Mapping):
+    """Read-only lazy mapping view over the arguments of a frame.
+
+    Argument values are looked up in the frame locals on access, so arguments
+    that are never read are never materialized.
+    """
+
+    __slots__ = ("_frame", "_names", "_locals")
+
+    def __init__(self, frame: FrameType) -> None:
+        code = frame.f_code
+        nargs = code.co_argcount + bool(code.co_flags & CO_VARARGS) + bool(code.co_flags & CO_VARKEYWORDS)
+        self._frame = frame
+        self._names = code.co_varnames[:nargs]
+        self._locals: Optional[Mapping[str, Any]] = None
+
+    def _frame_locals(self) -> Mapping[str, Any]:
+        _locals = self._locals
+        if _locals is None:
+            _locals = self._locals = self._frame.f_locals
+        return _locals
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._names:
+            return self._frame_locals()[name]
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
 def get_locals(frame: FrameType) -> Iterator[Tuple[str, Any]]:
     code = frame.f_code
     _locals = frame.f_locals
@@ -8,7 +8,9 @@ import threading
 from threading import Thread
 import time
 from types import FrameType
+from types import MappingProxyType
 from typing import Any
+from typing import Callable
 from typing import ClassVar
 from typing import Dict
 from typing import List
@@ -24,7 +26,7 @@ from ddtrace.debugging._probe.model import ProbeConditionMixin
 from ddtrace.debugging._probe.model import ProbeEvalTiming
 from ddtrace.debugging._probe.model import RateLimitMixin
 from ddtrace.debugging._probe.model import TimingMixin
-from ddtrace.debugging._safety import get_args
+from ddtrace.debugging._safety import FrameArgsView
 from ddtrace.debugging._session import Session
 from ddtrace.internal.compat import ExcInfoType
 from ddtrace.internal.metrics import Metrics
@@ -50,6 +52,45 @@ class SignalState(str, Enum):
     DONE = "DONE"
 
 
+class _LazyScope(Mapping):
+    """Lazy ``ChainMap``-like evaluation scope over a frame.
+
+    The underlying mappings are only materialized on first lookup, so probes
+    that never read the scope (e.g. no condition and nothing to capture) do
+    not pay for the frame walk of ``get_args`` or the ``f_locals`` snapshot.
+    """
+
+    __slots__ = ("_frame", "_extra", "_args_only", "_scope")
+
+    def __init__(self, frame: FrameType, extra: Optional[Mapping[str, Any]] = None, args_only: bool = False) -> None:
+        self._frame = frame
+        self._extra = extra
+        self._args_only = args_only
+        self._scope: Optional[Mapping[str, Any]] = None
+
+    def _materialize(self) -> Mapping[str, Any]:
+        scope = self._scope
+        if scope is None:
+            frame = self._frame
+            local_scope = FrameArgsView(frame) if self._args_only else frame.f_locals
+            maps = (local_scope, frame.f_globals) if self._extra is None else (self._extra, local_scope, frame.f_globals)
+            scope = self._scope = ChainMap(*maps)
+        return scope
+
+    def __getitem__(self, name: str) -> Any:
+        return self._materialize()[name]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+
+# Shared empty scope for exit paths that do not read the evaluation scope.
+_EMPTY_SCOPE: Mapping[str, Any] = MappingProxyType({})
+
+
 @dataclass
 class Signal(abc.ABC):
     """Debugger signal base class.
@@ -72,20 +113,24 @@ class Signal(abc.ABC):
     """
 
     __default_timing__: ClassVar[ProbeEvalTiming] = ProbeEvalTiming.EXIT
+    # Whether the concrete exit implementation reads the evaluation scope.
+    # Subclasses that ignore it can set this to False to skip the scope
+    # construction on exit when no condition needs evaluating.
+    __exit_needs_scope__: ClassVar[bool] = True
 
     probe: Probe
     frame: FrameType
     thread: Thread
     trace_context: Optional[Union[Span, Context]] = None
     state: str = SignalState.NONE
-    errors: List[EvaluationError] = field(default_factory=list)
     timestamp: float = field(default_factory=time.time)
-    uuid: str = field(default_factory=lambda: str(uuid4()), init=False)
+    _errors: Optional[List[EvaluationError]] = field(default=None, init=False, repr=False, compare=False)
+    _uuid: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         probe = self.probe
-        if isinstance(probe, TimingMixin):
-            eval_at = probe.evaluate_at
+        if probe.__has_timing__:
+            eval_at = cast(TimingMixin, probe).evaluate_at
             self._timing = self.__default_timing__ if eval_at is ProbeEvalTiming.DEFAULT else eval_at
         else:
             self._timing = ProbeEvalTiming.ENTRY
@@ -93,10 +138,11 @@ class Signal(abc.ABC):
     def _eval_condition(self, scope: Mapping[str, Any]) -> bool:
         """Evaluate the probe condition against the collected frame."""
         probe = self.probe
-        if not isinstance(probe, ProbeConditionMixin):
+        if not probe.__has_condition__:
             # The probe has no condition, so it should always trigger.
             return True
 
+        probe = cast(ProbeConditionMixin, probe)
         condition = probe.condition
         if condition is None:
             return True
@@ -119,11 +165,11 @@ class Signal(abc.ABC):
     def _rate_limit_exceeded(self) -> bool:
         """Evaluate the probe rate limiter."""
         probe = self.probe
-        if not isinstance(probe, RateLimitMixin):
+        if not probe.__has_rate_limit__:
             # We don't have a rate limiter, so no rate was exceeded.
             return False
 
-        exceeded = self.session is None and probe.limiter.limit() is RateLimitExceeded
+        exceeded = self.session is None and cast(RateLimitMixin, probe).limiter.limit() is RateLimitExceeded
         if exceeded:
             self.state = SignalState.SKIP_RATE
 
@@ -149,6 +195,25 @@ class Signal(abc.ABC):
                 return True
         return False
 
+    @property
+    def errors(self) -> List[EvaluationError]:
+        # DEV: created lazily since the vast majority of signals produce no
+        # evaluation errors, saving one list allocation per probe hit.
+        errors = self._errors
+        if errors is None:
+            errors = self._errors = []
+        return errors
+
+    @property
+    def uuid(self) -> str:
+        # DEV: generated lazily so that signals that end up skipped (e.g. by
+        # the rate limiter or a failing condition) never pay for the UUID
+        # generation and string formatting.
+        uuid = self._uuid
+        if uuid is None:
+            uuid = self._uuid = str(uuid4())
+        return uuid
+
     @property
     def session(self):
         session_id = self.probe.tags.get("session_id")
@@ -156,7 +221,7 @@ class Signal(abc.ABC):
 
     @property
     def args(self):
-        return dict(get_args(self.frame))
+        return FrameArgsView(self.frame)
 
     @abc.abstractmethod
     def enter(self, scope: Mapping[str, Any]) -> None:
@@ -177,7 +242,7 @@ class Signal(abc.ABC):
         if self._timing is not ProbeEvalTiming.ENTRY:
             return
 
-        scope = ChainMap(self.args, self.frame.f_globals)
+        scope = _LazyScope(self.frame, args_only=True)
         if not self._eval_condition(scope):
             return
 
@@ -197,6 +262,14 @@ class Signal(abc.ABC):
             # The signal has already been handled and move to a final state
             return
 
+        if self._timing is not ProbeEvalTiming.EXIT and not self.__exit_needs_scope__:
+            # No condition to evaluate on exit and the concrete exit
+            # implementation does not read the scope, so we can skip building
+            # it altogether.
+            self.exit(retval, cast(ExcInfoType, exc_info), duration or 0, _EMPTY_SCOPE)
+            self.state = SignalState.DONE
+            return
+
         frame = self.frame
         extra: Dict[str, Any] = {"@duration": duration / 1e6}  # milliseconds
 
@@ -206,7 +279,7 @@ class Signal(abc.ABC):
         else:
             extra["@return"] = retval
 
-        scope = ChainMap(extra, frame.f_locals, frame.f_globals)
+        scope = _LazyScope(frame, extra)
 
         if self._timing is ProbeEvalTiming.EXIT:
             # We only evaluate the condition and the rate limiter on exit if it
@@ -228,8 +301,7 @@ class Signal(abc.ABC):
         if not self._session_check():
             return
 
-        frame = self.frame
-        scope = ChainMap(frame.f_locals, frame.f_globals)
+        scope = _LazyScope(self.frame)
 
         if not self._eval_condition(scope):
             return
@@ -252,7 +324,16 @@ class Signal(abc.ABC):
     def from_probe(
         probe: Probe, frame: FrameType, thread: Thread, trace_context: Optional[Any], meter: Metrics.Meter
     ) -> "Signal":
-        return probe_to_signal(probe, frame, thread, trace_context, meter)
+        # DEV: singledispatch resolves the implementation by walking the MRO of
+        # the argument type on every call. Probe types are a small, fixed set,
+        # so we cache the resolved constructor per concrete type and turn the
+        # hot-path lookup into a single dict access.
+        probe_type = type(probe)
+        try:
+            ctor = _signal_ctor_cache[probe_type]
+        except KeyError:
+            ctor = _signal_ctor_cache[probe_type] = probe_to_signal.dispatch(probe_type)
+        return ctor(probe, frame, thread, trace_context, meter)
 
 
 @singledispatch
@@ -264,3 +345,7 @@ def probe_to_signal(
     meter: Metrics.Meter,
 ) -> Signal:
     raise TypeError(f"Unsupported probe type: {type(probe)}")
+
+
+# Inline cache for Signal.from_probe, keyed on the concrete probe type.
+_signal_ctor_cache: Dict[type, Callable[..., Signal]] = {}
@@ -32,6 +32,9 @@ PROBE_ID_TAG_NAME = "debugger.probeid"
 class DynamicSpan(Signal):
     """Dynamically created span"""
 
+    # Closing the span does not read the evaluation scope
+    __exit_needs_scope__: t.ClassVar[bool] = False
+
     _span_cm: t.Optional[Span] = field(init=False, default=None)
 
     def __post_init__(self) -> None:
@@ -42,17 +45,18 @@ class DynamicSpan(Signal):
     def enter(self, scope: t.Mapping[str, t.Any]) -> None:
         probe = t.cast(SpanFunctionProbe, self.probe)
 
-        self._span_cm = ddtrace.tracer.trace(
+        span_cm = self._span_cm = ddtrace.tracer.trace(
             SPAN_NAME,
             service=None,  # Currently unused
             resource=probe.func_qname,
             span_type=None,  # Currently unused
         )
-        span = self._span_cm.__enter__()
+        span = span_cm.__enter__()
 
         span.set_tags(probe.tags)  # type: ignore[arg-type]
-        span.set_tag_str(PROBE_ID_TAG_NAME, probe.probe_id)
-        span.set_tag_str(_ORIGIN_KEY, "di")
+        set_tag_str = span.set_tag_str
+        set_tag_str(PROBE_ID_TAG_NAME, probe.probe_id)
+        set_tag_str(_ORIGIN_KEY, "di")
 
     def exit(self, retval: t.Any, exc_info: ExcInfoType, duration: float, scope: t.Mapping[str, t.Any]) -> None:
         if self._span_cm is not None:
@@ -70,19 +74,26 @@ class SpanDecoration(LogSignal):
     def _decorate_span(self, scope: t.Mapping[str, t.Any]) -> None:
         probe = t.cast(SpanDecorationMixin, self.probe)
 
-        if probe.target_span == SpanDecorationTargetSpan.ACTIVE:
-            span = ddtrace.tracer.current_span()
-        elif probe.target_span == SpanDecorationTargetSpan.ROOT:
-            span = ddtrace.tracer.current_root_span()
+        # DEV: resolve the tracer and the probe attributes into locals once
+        # per call; this method runs on every hit of a span decoration probe.
+        tracer = ddtrace.tracer
+        target_span = probe.target_span
+        if target_span == SpanDecorationTargetSpan.ACTIVE:
+            span = tracer.current_span()
+        elif target_span == SpanDecorationTargetSpan.ROOT:
+            span = tracer.current_root_span()
         else:
-            log.error("Invalid target span for span decoration: %s", probe.target_span)
+            log.error("Invalid target span for span decoration: %s", target_span)
             return
 
         if span is not None:
             log.debug("Decorating span %r according to span decoration probe %r", span, probe)
+            set_tag_str = span.set_tag_str
+            probe_id = t.cast(Probe, probe).probe_id
             for d in probe.decorations:
                 try:
-                    if not (d.when is None or d.when(scope)):
+                    when = d.when
+                    if not (when is None or when(scope)):
                         continue
                 except DDExpressionEvaluationError as e:
                     self.errors.append(
@@ -93,12 +104,17 @@ class SpanDecoration(LogSignal):
                     try:
                         tag_value = tag.value.render(scope, serialize)
                     except DDExpressionEvaluationError as e:
-                        span.set_tag_str(
-                            "_dd.di.%s.evaluation_error" % tag.name, ", ".join([serialize(v) for v in e.args])
-                        )
+                        set_tag_str(tag.error_tag_name, ", ".join([serialize(v) for v in e.args]))
                     else:
-                        span.set_tag_str(tag.name, tag_value if _isinstance(tag_value, str) else serialize(tag_value))
-                        span.set_tag_str("_dd.di.%s.probe_id" % tag.name, t.cast(Probe, probe).probe_id)
+                        # DEV: exact type check first to spare the safe
+                        # isinstance wrapper for the common case of a plain str
+                        set_tag_str(
+                            tag.name,
+                            tag_value
+                            if type(tag_value) is str or _isinstance(tag_value, str)
+                            else serialize(tag_value),
+                        )
+                        set_tag_str(tag.probe_id_tag_name, probe_id)
 
     def enter(self, scope: t.Mapping[str, t.Any]) -> None:
         self._decorate_span(scope)
@@ -111,6 +111,36 @@ def dispatch(event_id: str, args: Tuple[Any, ...] = ()) -> None:
                 raise
 
 
+def dispatch_one(event_id: str, args: Tuple[Any, ...] = ()) -> Any:
+    """Call all hooks for the provided event_id and return the first hook's raw result.
+
+    This is a fast path for events that are known to have a single listener
+    producing a single value: it skips the EventResultDict and EventResult
+    allocations that dispatch_with_results performs on every call.
+    """
+    global _listeners
+    global _all_listeners
+
+    for hook in _all_listeners:
+        try:
+            hook(event_id, args)
+        except Exception:
+            if config._raise:
+                raise
+
+    hooks = _listeners.get(event_id)
+    if not hooks:
+        return None
+
+    for local_hook in hooks.values():
+        try:
+            return local_hook(*args)
+        except Exception:
+            if config._raise:
+                raise
+    return None
+
+
 def dispatch_with_results(event_id: str, args: Tuple[Any, ...] = ()) -> EventResultDict:
     """Call all hooks for the provided event_id with the provided args
     returning the results and exceptions from the called hooks
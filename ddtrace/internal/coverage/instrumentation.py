@@ -1,15 +1,21 @@
+from importlib import import_module
 import sys
 
 
-# Import are noqa'd otherwise some formatters will helpfully remove them
-if sys.version_info >= (3, 13):
-    from ddtrace.internal.coverage.instrumentation_py3_13 import instrument_all_lines  # noqa
-elif sys.version_info >= (3, 12):
-    from ddtrace.internal.coverage.instrumentation_py3_12 import instrument_all_lines  # noqa
-elif sys.version_info >= (3, 11):
-    from ddtrace.internal.coverage.instrumentation_py3_11 import instrument_all_lines  # noqa
-elif sys.version_info >= (3, 10):
-    from ddtrace.internal.coverage.instrumentation_py3_10 import instrument_all_lines  # noqa
-else:
-    # Python 3.8 and 3.9 use the same instrumentation
-    from ddtrace.internal.coverage.instrumentation_py3_8 import instrument_all_lines  # noqa
+# Table of version-specific implementations, keyed on the minor version.
+# Python 3.8 and 3.9 use the same instrumentation; versions newer than the
+# latest entry fall back to the most recent implementation.
+_VERSIONED_MODULES = {
+    (3, 8): "instrumentation_py3_8",
+    (3, 9): "instrumentation_py3_8",
+    (3, 10): "instrumentation_py3_10",
+    (3, 11): "instrumentation_py3_11",
+    (3, 12): "instrumentation_py3_12",
+    (3, 13): "instrumentation_py3_13",
+}
+
+instrument_all_lines = import_module(
+    "ddtrace.internal.coverage.%s" % _VERSIONED_MODULES.get(sys.version_info[:2], "instrumentation_py3_13")
+).instrument_all_lines
+
+__all__ = ["instrument_all_lines"]
@@ -1,4 +1,5 @@
 from abc import ABC
+from collections import deque
 from dataclasses import dataclass
 import dis
 from enum import Enum
@@ -15,16 +16,23 @@ from ddtrace.internal.test_visibility.coverage_lines import CoverageLines
 assert sys.version_info >= (3, 11) and sys.version_info < (3, 12)  # nosec
 
 
+_BACKWARD_JUMP_OPCODES = frozenset(op for op in dis.hasjrel if "BACKWARD" in dis.opname[op])
+
+
 class JumpDirection(int, Enum):
     FORWARD = 1
     BACKWARD = -1
 
     @classmethod
     def from_opcode(cls, opcode: int) -> "JumpDirection":
-        return cls.BACKWARD if "BACKWARD" in dis.opname[opcode] else cls.FORWARD
+        # DEV: the jump opcode universe is fixed, so test against the
+        # precomputed set instead of scanning the opcode name
+        return cls.BACKWARD if opcode in _BACKWARD_JUMP_OPCODES else cls.FORWARD
 
 
 class Jump(ABC):
+    __slots__ = ("start", "end", "arg")
+
     def __init__(self, start: int, arg: int) -> None:
         self.start = start
         self.end: t.Optional[int] = None
@@ -32,6 +40,8 @@ class Jump(ABC):
 
 
 class RJump(Jump):
+    __slots__ = ("direction",)
+
     __opcodes__ = set(dis.hasjrel)
 
     def __init__(self, start: int, arg: int, direction: JumpDirection) -> None:
@@ -48,10 +58,14 @@ class Instruction:
         self.offset = offset
         self.opcode = opcode
         self.arg = arg
-        self.targets: t.List["Branch"] = []
+        # DEV: only jump targets ever carry branches, so the list is created
+        # lazily to avoid one allocation per instruction
+        self.targets: t.Optional[t.List["Branch"]] = None
 
 
 class Branch:
+    __slots__ = ("start", "end")
+
     def __init__(self, start: Instruction, end: Instruction) -> None:
         self.start = start
         self.end = end
@@ -74,29 +88,25 @@ def instr_with_arg(opcode: int, arg: int) -> t.List[Instruction]:
     return instructions
 
 
-def from_varint(iterator: t.Iterator[int]) -> int:
-    b = next(iterator)
-    val = b & 63
-    while b & 64:
-        val <<= 6
-        b = next(iterator)
-        val |= b & 63
-    return val
-
-
 def to_varint(value: int, set_begin_marker: bool = False) -> bytes:
     # Encode value as a varint on 7 bits (MSB should come first) and set
     # the begin marker if requested.
-    temp = bytearray()
     if value < 0:
         raise ValueError("Invalid value for varint")
+    # DEV: write into an exact-size buffer from the tail; prepending into a
+    # bytearray shifts the whole buffer on every byte
+    size = max(1, (value.bit_length() + 5) // 6)
+    buf = bytearray(size)
+    i = size - 1
+    buf[i] = value & 63
+    value >>= 6
     while value:
-        temp.insert(0, value & 63 | (64 if temp else 0))
+        i -= 1
+        buf[i] = value & 63 | 64
         value >>= 6
-    temp = temp or bytearray([0])
     if set_begin_marker:
-        temp[0] |= 128
-    return bytes(temp)
+        buf[0] |= 128
+    return bytes(buf)
 
 
 def consume_varint(stream: t.Iterable[int]) -> bytes:
@@ -117,6 +127,9 @@ def consume_varint(stream: t.Iterable[int]) -> bytes:
 
 consume_signed_varint = consume_varint  # They are the same thing for our purposes
 
+# A full 8-code-unit "no location" linetable record (0x80 | (0xF << 3) | 7).
+_NO_LOCATION_FULL_RECORD = bytes([0x80 | (0xF << 3) | 7])
+
 
 def update_location_data(
     code: CodeType, trap_map: t.Dict[int, int], ext_arg_offsets: t.List[t.Tuple[int, int]]
@@ -126,8 +139,11 @@ def update_location_data(
 
     data = code.co_linetable
     data_iter = iter(data)
-    ext_arg_offset_iter = iter(sorted(ext_arg_offsets))
-    ext_arg_offset, ext_arg_size = next(ext_arg_offset_iter, (None, None))
+    # DEV: walk the sorted offsets with a positional pointer; in the common
+    # case of no EXTENDED_ARGs the per-record check is a single comparison
+    ext_arg_offsets = sorted(ext_arg_offsets)
+    n_ext_arg_offsets = len(ext_arg_offsets)
+    ext_arg_index = 0
 
     original_offset = offset = 0
     while True:
@@ -157,8 +173,10 @@ def update_location_data(
                 # No location info for the trap bytecode
                 trap_size = trap_map[original_offset]
                 n, r = divmod(trap_size, 8)
-                for _ in range(n):
-                    new_data.append(0x80 | (0xF << 3) | 7)
+                if n:
+                    # DEV: emit the repeated full records with a single
+                    # C-level copy instead of appending one byte at a time
+                    new_data.extend(_NO_LOCATION_FULL_RECORD * n)
                 if r:
                     new_data.append(0x80 | (0xF << 3) | r - 1)
                 offset += trap_size << 1
@@ -166,14 +184,16 @@ def update_location_data(
             # Extend the line table record if we added any EXTENDED_ARGs
             original_offset += offset_delta
             offset += offset_delta
-            if ext_arg_offset is not None and offset > ext_arg_offset:
-                room = 7 - offset_delta
-                chunk[0] += min(room, t.cast(int, ext_arg_size))
-                if room < t.cast(int, ext_arg_size):
-                    chunk.append(0x80 | (0xF << 3) | t.cast(int, ext_arg_size) - room)
-                offset += ext_arg_size << 1
+            if ext_arg_index < n_ext_arg_offsets:
+                ext_arg_offset, ext_arg_size = ext_arg_offsets[ext_arg_index]
+                if offset > ext_arg_offset:
+                    room = 7 - offset_delta
+                    chunk[0] += min(room, ext_arg_size)
+                    if room < ext_arg_size:
+                        chunk.append(0x80 | (0xF << 3) | ext_arg_size - room)
+                    offset += ext_arg_size << 1
 
-                ext_arg_offset, ext_arg_size = next(ext_arg_offset_iter, (None, None))
+                    ext_arg_index += 1
 
             new_data.extend(chunk)
         except StopIteration:
@@ -191,17 +211,27 @@ class ExceptionTableEntry:
 
 
 def parse_exception_table(code: CodeType):
-    iterator = iter(code.co_exceptiontable)
-    try:
-        while True:
-            start = from_varint(iterator) << 1
-            length = from_varint(iterator) << 1
-            end = start + length - 2  # Present as inclusive, not exclusive
-            target = from_varint(iterator) << 1
-            dl = from_varint(iterator)
-            yield ExceptionTableEntry(start, end, target, dl)
-    except StopIteration:
-        return
+    # DEV: decode the varints by indexing into the table directly; driving an
+    # iterator through a helper costs a next() call per byte on a path that
+    # runs for every code object with a try block.
+    data = code.co_exceptiontable
+    size = len(data)
+    pos = 0
+    while pos < size:
+        fields = []
+        for _ in range(4):
+            b = data[pos]
+            pos += 1
+            val = b & 63
+            while b & 64:
+                b = data[pos]
+                pos += 1
+                val = (val << 6) | (b & 63)
+            fields.append(val)
+        start, length, target, dl = fields
+        start <<= 1
+        end = start + (length << 1) - 2  # Present as inclusive, not exclusive
+        yield ExceptionTableEntry(start, end, target << 1, dl)
 
 
 def compile_exception_table(exc_table: t.List[ExceptionTableEntry]) -> bytes:
@@ -261,7 +291,7 @@ def instrument_all_lines(code: CodeType, hook: HookType, path: str, package: str
     seen_lines = CoverageLines()
 
     exc_table = list(parse_exception_table(code))
-    exc_table_offsets = {_ for e in exc_table for _ in (e.start, e.end, e.target)}
+    exc_table_offsets = frozenset(_ for e in exc_table for _ in (e.start, e.end, e.target))
     offset_map = {}
 
     # Collect all the original jumps
@@ -270,18 +300,36 @@ def instrument_all_lines(code: CodeType, hook: HookType, path: str, package: str
     line_map = {}
     line_starts = dict(dis.findlinestarts(code))
 
+    co_code = code.co_code
+
     # Find the offset of the RESUME opcode. We should not add any instrumentation before this point.
     resume_offset = NO_OFFSET
-    for i in range(0, len(code.co_code), 2):
-        if code.co_code[i] == RESUME:
-            resume_offset = i
-            break
+    if co_code and co_code[0] == RESUME:
+        # All but generator and coroutine code objects start with RESUME, so
+        # the common case does not need a scan.
+        resume_offset = 0
+    else:
+        for i in range(0, len(co_code), 2):
+            if co_code[i] == RESUME:
+                resume_offset = i
+                break
 
     # If we are looking at an empty module, we trick ourselves into instrumenting line 0 by skipping the RESUME at index
     # and instrumenting the second offset:
-    if code.co_name == "<module>" and line_starts == {0: 0} and code.co_code == EMPTY_BYTECODE:
+    if code.co_name == "<module>" and line_starts == {0: 0} and co_code == EMPTY_BYTECODE:
         line_starts = {2: 0}
 
+    # Collect the seen lines and the offsets where a trap call can be injected
+    # once, so that the instruction loop below only pays for a single dict
+    # lookup per instruction.
+    trap_starts: t.Dict[int, int] = {}
+    for line_offset, line in line_starts.items():
+        if line_offset <= resume_offset:
+            continue
+        seen_lines.add(line)
+        if co_code[line_offset] not in SKIP_LINES:
+            trap_starts[line_offset] = line
+
     # The previous two arguments are kept in order to track the depth of the IMPORT_NAME
     # For example, from ...package import module
     current_arg: int = 0
@@ -290,85 +338,74 @@ def instrument_all_lines(code: CodeType, hook: HookType, path: str, package: str
     current_import_name: t.Optional[str] = None
     current_import_package: t.Optional[str] = None
 
-    try:
-        code_iter = iter(enumerate(code.co_code))
-        ext: list[bytes] = []
-        while True:
-            original_offset, opcode = next(code_iter)
-
-            if original_offset in exc_table_offsets:
-                offset_map[original_offset] = len(instructions) << 1
-
-            if original_offset in line_starts and original_offset > resume_offset:
-                line = line_starts[original_offset]
-                if code.co_code[original_offset] not in SKIP_LINES:
-                    # Inject trap call at the beginning of the line. Keep
-                    # track of location and size of the trap call
-                    # instructions. We need this to adjust the location
-                    # table.
-                    trap_instructions = trap_call(trap_index, len(new_consts))
-                    traps[original_offset] = len(trap_instructions)
-                    instructions.extend(trap_instructions)
-
-                    # Make sure that the current module is marked as depending on its own package by instrumenting the
-                    # first executable line
-                    package_dep = None
-                    if code.co_name == "<module>" and len(new_consts) == len(code.co_consts) + 1:
-                        package_dep = (package, ("",))
-
-                    new_consts.append((line, trap_arg, package_dep))
-
-                    line_map[original_offset] = trap_instructions[0]
-
-                seen_lines.add(line)
-
-            _, arg = next(code_iter)
-
-            offset = len(instructions) << 1
-
-            # Propagate code
-            instructions.append(Instruction(original_offset, opcode, arg))
-
-            if opcode is EXTENDED_ARG:
-                ext.append(arg)
-                continue
-            else:
-                _previous_previous_arg = previous_arg
-                previous_arg = current_arg
-                current_arg = int.from_bytes([*ext, arg], "big", signed=False)
-                ext.clear()
-
-            # Track imports names
-            if opcode == IMPORT_NAME:
-                import_depth = code.co_consts[_previous_previous_arg]
-                current_import_name = code.co_names[current_arg]
-                # Adjust package name if the import is relative and a parent (ie: if depth is more than 1)
-                current_import_package = (
-                    ".".join(package.split(".")[: -import_depth + 1]) if import_depth > 1 else package
-                )
-                new_consts[-1] = (
-                    new_consts[-1][0],
-                    new_consts[-1][1],
-                    (current_import_package, (current_import_name,)),
-                )
-
-            # Also track import from statements since it's possible that the "from" target is a module, eg:
-            # from my_package import my_module
-            # Since the package has not changed, we simply extend the previous import names with the new value
-            if opcode == IMPORT_FROM:
-                import_from_name = f"{current_import_name}.{code.co_names[current_arg]}"
-                new_consts[-1] = (
-                    new_consts[-1][0],
-                    new_consts[-1][1],
-                    (new_consts[-1][2][0], tuple(list(new_consts[-1][2][1]) + [import_from_name])),
-                )
-
-            # Collect branching instructions for processing
-            if opcode in RJump.__opcodes__:
-                jumps[offset] = RJump(original_offset, current_arg, JumpDirection.from_opcode(opcode))
-
-    except StopIteration:
-        pass
+    # DEV: scan the bytecode by index instead of pulling (offset, byte) pairs
+    # from an enumerate iterator; this avoids two next() calls and a tuple
+    # allocation per instruction on this compile-time hot path.
+    # Accumulator for EXTENDED_ARG prefixes; reset after every complete
+    # instruction so the common no-prefix case is a single shift-or.
+    ext_acc = 0
+    for original_offset in range(0, len(co_code), 2):
+        opcode = co_code[original_offset]
+        arg = co_code[original_offset + 1]
+
+        if original_offset in exc_table_offsets:
+            offset_map[original_offset] = len(instructions) << 1
+
+        line = trap_starts.get(original_offset)
+        if line is not None:
+            # Inject trap call at the beginning of the line. Keep
+            # track of location and size of the trap call
+            # instructions. We need this to adjust the location
+            # table.
+            trap_instructions = trap_call(trap_index, len(new_consts))
+            traps[original_offset] = len(trap_instructions)
+            instructions.extend(trap_instructions)
+
+            # Make sure that the current module is marked as depending on its own package by instrumenting the
+            # first executable line
+            package_dep = None
+            if code.co_name == "<module>" and len(new_consts) == len(code.co_consts) + 1:
+                package_dep = (package, ("",))
+
+            new_consts.append((line, trap_arg, package_dep))
+
+            line_map[original_offset] = trap_instructions[0]
+
+        offset = len(instructions) << 1
+
+        # Propagate code
+        instructions.append(Instruction(original_offset, opcode, arg))
+
+        if opcode is EXTENDED_ARG:
+            ext_acc = (ext_acc | arg) << 8
+            continue
+        else:
+            _previous_previous_arg = previous_arg
+            previous_arg = current_arg
+            current_arg = ext_acc | arg
+            ext_acc = 0
+
+        # Track imports names
+        if opcode == IMPORT_NAME:
+            import_depth = code.co_consts[_previous_previous_arg]
+            current_import_name = code.co_names[current_arg]
+            # Adjust package name if the import is relative and a parent (ie: if depth is more than 1)
+            current_import_package = ".".join(package.split(".")[: -import_depth + 1]) if import_depth > 1 else package
+            last = new_consts[-1]
+            new_consts[-1] = (last[0], last[1], (current_import_package, (current_import_name,)))
+
+        # Also track import from statements since it's possible that the "from" target is a module, eg:
+        # from my_package import my_module
+        # Since the package has not changed, we simply extend the previous import names with the new value
+        if opcode == IMPORT_FROM:
+            import_from_name = f"{current_import_name}.{code.co_names[current_arg]}"
+            last = new_consts[-1]
+            deps = last[2]
+            new_consts[-1] = (last[0], last[1], (deps[0], deps[1] + (import_from_name,)))
+
+        # Collect branching instructions for processing
+        if opcode in RJump.__opcodes__:
+            jumps[offset] = RJump(original_offset, current_arg, JumpDirection.from_opcode(opcode))
 
     # Collect all the old jump start and end offsets
     jump_targets = {_ for j in jumps.values() for _ in (j.start, j.end)}
@@ -391,6 +428,8 @@ def instrument_all_lines(code: CodeType, hook: HookType, path: str, package: str
         # beginning of the trap call instead
         target_instr = line_map.get(jump.end, instructions[new_end >> 1])
         branch = Branch(instructions[new_start >> 1], target_instr)
+        if target_instr.targets is None:
+            target_instr.targets = []
         target_instr.targets.append(branch)
 
         branches.append(branch)
@@ -402,59 +441,74 @@ def instrument_all_lines(code: CodeType, hook: HookType, path: str, package: str
         e.target = instructions[offset_map[e.target] >> 1]
 
     # Process all the branching instructions to adjust the arguments. We
-    # need to add EXTENDED_ARGs if the argument is too large.
-    process_branches = True
+    # need to add EXTENDED_ARGs if the argument is too large. Inserting an
+    # EXTENDED_ARG only changes the distance of the branches that straddle
+    # the insertion point, so we keep a worklist of the branches to revisit
+    # instead of reprocessing all of them to a fixed point.
     exts: t.List[t.Tuple[Instruction, int]] = []
-    while process_branches:
-        process_branches = False
-        for branch in branches:
-            jump_instr = branch.start
-            new_arg = branch.arg
-            jump_instr.arg = new_arg & 0xFF
-            new_arg >>= 8
-            c = 0
-            index = jump_instr.offset >> 1
-
-            # Update the argument of the branching instruction, adding
-            # EXTENDED_ARGs if needed
-            while new_arg:
-                if index and instructions[index - 1].opcode is EXTENDED_ARG:
-                    index -= 1
-                    instructions[index].arg = new_arg & 0xFF
-                else:
-                    ext_instr = Instruction(index << 1, EXTENDED_ARG, new_arg & 0xFF)
-                    instructions.insert(index, ext_instr)
-                    c += 1
-                    # If the jump instruction was a target of another jump,
-                    # make the latest EXTENDED_ARG instruction the target
-                    # of that jump.
-                    if jump_instr.targets:
-                        for target in jump_instr.targets:
-                            if target.end is not jump_instr:
-                                raise ValueError("Invalid target")
-                            target.end = ext_instr
-                        ext_instr.targets.extend(jump_instr.targets)
-                        jump_instr.targets.clear()
-                new_arg >>= 8
-
-            # Check if we added any EXTENDED_ARGs because we would have to
-            # reprocess the branches.
-            # TODO[perf]: only reprocess the branches that are affected.
-            # However, this branch is not expected to be taken often.
-            if c:
-                exts.append((ext_instr, c))
+    worklist = deque(branches)
+    queued = set(worklist)
+    while worklist:
+        branch = worklist.popleft()
+        queued.discard(branch)
+
+        jump_instr = branch.start
+        new_arg = branch.arg
+        jump_instr.arg = new_arg & 0xFF
+        new_arg >>= 8
+        c = 0
+        index = jump_instr.offset >> 1
+
+        # Update the argument of the branching instruction, adding
+        # EXTENDED_ARGs if needed
+        while new_arg:
+            if index and instructions[index - 1].opcode is EXTENDED_ARG:
+                index -= 1
+                instructions[index].arg = new_arg & 0xFF
+            else:
+                ext_instr = Instruction(index << 1, EXTENDED_ARG, new_arg & 0xFF)
+                instructions.insert(index, ext_instr)
+                c += 1
+                # If the jump instruction was a target of another jump,
+                # make the latest EXTENDED_ARG instruction the target
+                # of that jump.
+                if jump_instr.targets:
+                    for target in jump_instr.targets:
+                        if target.end is not jump_instr:
+                            raise ValueError("Invalid target")
+                        target.end = ext_instr
+                    ext_instr.targets = jump_instr.targets
+                    jump_instr.targets = None
+
                 # Update the instruction offset from the point of insertion
-                # of the EXTENDED_ARGs
+                # of the EXTENDED_ARG
                 for instr_index, instr in enumerate(instructions[index + 1 :], index + 1):
                     instr.offset = instr_index << 1
 
-                process_branches = True
+                # Requeue the branches whose distance was changed by the
+                # insertion, that is those with exactly one end on either
+                # side of the new instruction (including, for backward
+                # jumps, the current branch itself).
+                ins_offset = index << 1
+                for other in branches:
+                    if ((other.start.offset > ins_offset) is not (other.end.offset > ins_offset)) and (
+                        other not in queued
+                    ):
+                        worklist.append(other)
+                        queued.add(other)
+            new_arg >>= 8
+
+        if c:
+            exts.append((ext_instr, c))
 
     # Create the new code object
-    new_code = bytearray()
-    for instr in instructions:
-        new_code.append(instr.opcode)
-        new_code.append(instr.arg)
+    # DEV: the final size is known, so write into a preallocated buffer
+    # instead of growing a bytearray two appends at a time
+    new_code = bytearray(len(instructions) << 1)
+    for index, instr in enumerate(instructions):
+        offset = index << 1
+        new_code[offset] = instr.opcode
+        new_code[offset + 1] = instr.arg
 
     # Instrument nested code objects recursively
     for original_offset, nested_code in enumerate(code.co_consts):
@@ -1,4 +1,5 @@
 import ast
+from bisect import bisect_right
 import json
 import linecache
 import os
@@ -18,6 +19,24 @@ NOCOVER_PRAGMA_RE = re.compile(r"^\s*(?P<command>.*)\s*#.*\s+pragma\s*:\s*no\s?c
 
 ast_cache: t.Dict[str, t.Any] = {}
 
+_nocover_lines_cache: t.Dict[str, t.FrozenSet[int]] = {}
+
+
+def _pragma_line_set(path: str) -> t.FrozenSet[int]:
+    """Return the line numbers of ``path`` that carry a nocover pragma.
+
+    The source is scanned once per file so that the report loops only pay a
+    set intersection per file instead of a regex match per executable line.
+    """
+    pragma_lines = _nocover_lines_cache.get(path)
+    if pragma_lines is None:
+        pragma_lines = _nocover_lines_cache[path] = frozenset(
+            lineno
+            for lineno, line in enumerate(linecache.getlines(path), 1)
+            if "pragma" in line and NOCOVER_PRAGMA_RE.match(line)
+        )
+    return pragma_lines
+
 
 def _get_relative_path_strings(executable_lines, workspace_path: Path) -> t.Dict[str, str]:
     relative_path_strs: t.Dict[str, str] = {}
@@ -38,24 +57,49 @@ def _get_ast_for_path(path: str):
     return ast_cache[path]
 
 
-def find_statement_for_line(node, line):
+_block_index_cache: t.Dict[str, t.Tuple[t.List[int], t.List[t.Tuple[int, int]]]] = {}
+
+
+def _collect_block_spans(node, spans: t.List[t.Tuple[int, int]]) -> None:
+    # DEV: only recurse over body statements, mirroring the traversal that
+    # pragma resolution has always used: a block reachable only through an
+    # orelse or handler attribute resolves to its enclosing statement.
     if hasattr(node, "body"):
         for child_node in node.body:
-            found_node = find_statement_for_line(child_node, line)
-            if found_node is not None:
-                return found_node
+            _collect_block_spans(child_node, spans)
 
     if not hasattr(node, "end_lineno"):
-        return None
+        return
 
     # If the start and end line numbers are the same, we're (almost certainly) dealing with some kind of
     # statement instead of the sort of block statements we're looking for.
-    if node.lineno == node.end_lineno:
-        return None
+    if node.lineno != node.end_lineno:
+        spans.append((node.lineno, node.end_lineno))
 
-    if node.lineno <= line <= node.end_lineno:
-        return node
 
+def _get_block_index_for_path(path: str) -> t.Tuple[t.List[int], t.List[t.Tuple[int, int]]]:
+    index = _block_index_cache.get(path)
+    if index is None:
+        spans: t.List[t.Tuple[int, int]] = []
+        _collect_block_spans(_get_ast_for_path(path), spans)
+        # Sort outer blocks before the blocks they contain so that a backward
+        # scan finds the innermost match first.
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        index = _block_index_cache[path] = ([start for start, _ in spans], spans)
+    return index
+
+
+def find_statement_for_line(path: str, line: int) -> t.Optional[t.Tuple[int, int]]:
+    """Return the span of the innermost block statement containing ``line``.
+
+    The block spans are indexed once per file so that each lookup is a binary
+    search instead of a full AST walk.
+    """
+    starts, spans = _get_block_index_for_path(path)
+    for i in range(bisect_right(starts, line) - 1, -1, -1):
+        span = spans[i]
+        if span[1] >= line:
+            return span
     return None
 
 
@@ -64,14 +108,17 @@ def no_cover(path, src_line) -> t.Optional[t.Tuple[int, int]]:
 
     If the line ends with a :, parse the AST and return the block the line belongs to.
     """
-    text = linecache.getline(path, src_line).strip()
+    text = linecache.getline(path, src_line)
+    if "pragma" not in text:
+        # Cheap substring reject; the regex allows leading whitespace so the
+        # line does not need stripping either.
+        return None
     matches = NOCOVER_PRAGMA_RE.match(text)
     if matches:
         if matches["command"].strip().endswith(":"):
-            parsed = _get_ast_for_path(path)
-            statement = find_statement_for_line(parsed, src_line)
+            statement = find_statement_for_line(path, src_line)
             if statement is not None:
-                return statement.lineno, statement.end_lineno
+                return statement
             # We shouldn't get here, in theory, but if we do, let's not consider anything uncovered.
             return None
         # If our line does not end in ':', assume it's just one line that needs to be removed
@@ -79,6 +126,30 @@ def no_cover(path, src_line) -> t.Optional[t.Tuple[int, int]]:
     return None
 
 
+def _apply_nocover(path: str, orig_lines: t.Set[int], covered: t.Set[int]) -> t.Tuple[t.Set[int], t.Set[int]]:
+    """Return the executable and covered lines of a file with nocover blocks stripped.
+
+    The input sets are returned as-is, without copying, when the file has no
+    applicable pragma; callers must treat the result as read-only.
+    """
+    pragma_lines = _pragma_line_set(path) & orig_lines
+    if not pragma_lines:
+        return orig_lines, covered
+
+    path_lines = orig_lines.copy()
+    path_covered = covered.copy()
+    for line in sorted(pragma_lines):
+        # We may have already deleted this line due to no_cover
+        if line not in path_lines and line not in path_covered:
+            continue
+        no_cover_lines = no_cover(path, line)
+        if no_cover_lines:
+            for no_cover_line in range(no_cover_lines[0], no_cover_lines[1] + 1):
+                path_lines.discard(no_cover_line)
+                path_covered.discard(no_cover_line)
+    return path_lines, path_covered
+
+
 def print_coverage_report(executable_lines, covered_lines, workspace_path: Path, ignore_nocover=False):
     total_executable_lines = 0
     total_covered_lines = 0
@@ -102,18 +173,12 @@ def print_coverage_report(executable_lines, covered_lines, workspace_path: Path,
     print("-" * (w))
 
     for path, orig_lines in sorted(executable_lines.items()):
-        path_lines = orig_lines.copy()
-        path_covered = covered_lines[path].copy()
-        if not ignore_nocover:
-            for line in orig_lines:
-                # We may have already deleted this line due to no_cover
-                if line not in path_lines and line not in path_covered:
-                    continue
-                no_cover_lines = no_cover(path, line)
-                if no_cover_lines:
-                    for no_cover_line in range(no_cover_lines[0], no_cover_lines[1] + 1):
-                        path_lines.discard(no_cover_line)
-                        path_covered.discard(no_cover_line)
+        if ignore_nocover:
+            # DEV: the line sets are only read below, so no copies are needed
+            path_lines = orig_lines
+            path_covered = covered_lines[path]
+        else:
+            path_lines, path_covered = _apply_nocover(path, orig_lines, covered_lines[path])
 
         n_lines = len(path_lines)
         n_covered = len(path_covered)
@@ -160,18 +225,12 @@ def gen_json_report(
         relative_path_strs.update(_get_relative_path_strings(executable_lines, workspace_path))
 
     for path, orig_lines in sorted(executable_lines.items()):
-        path_lines = orig_lines.copy()
-        path_covered = covered_lines[path].copy()
-        if not ignore_nocover:
-            for line in orig_lines:
-                # We may have already deleted this line due to no_cover
-                if line not in path_lines and line not in path_covered:
-                    continue
-                no_cover_lines = no_cover(path, line)
-                if no_cover_lines:
-                    for no_cover_line in range(no_cover_lines[0], no_cover_lines[1] + 1):
-                        path_lines.discard(no_cover_line)
-                        path_covered.discard(no_cover_line)
+        if ignore_nocover:
+            # DEV: the line sets are only read below, so no copies are needed
+            path_lines = orig_lines
+            path_covered = covered_lines[path]
+        else:
+            path_lines, path_covered = _apply_nocover(path, orig_lines, covered_lines[path])
 
         path_str = relative_path_strs[path] if workspace_path is not None else path
 
@@ -13,10 +13,10 @@ Session-level coverage does not need special-casing since the ModuleCodeCollecto
 thread-safe.
 """
 import pickle  # nosec: B403  -- pickle is only used to serialize coverage data from a spawned thread to the main thread
-from queue import Queue
 import threading
 
 from ddtrace.internal.coverage.code import ModuleCodeCollector
+from ddtrace.internal.coverage.code import ctx_coverage_enabled
 from ddtrace.internal.logger import get_logger
 
 
@@ -40,10 +40,16 @@ class CoverageCollectingThread(threading.Thread):
 
         Only enables coverage if the parent process' context-level coverage is enabled.
         """
-        self._should_cover = ModuleCodeCollector.is_installed() and ModuleCodeCollector.coverage_enabled_in_context()
+        # DEV: test the context variable first: it is almost always False and
+        # much cheaper to read than the collector class-method checks, which
+        # this patched __init__ would otherwise pay on every thread creation.
+        self._should_cover = ctx_coverage_enabled.get() and ModuleCodeCollector.is_installed()
 
         if self._should_cover:
-            self._coverage_queue = Queue()
+            # DEV: a plain attribute is enough to hand the data over; join()
+            # only reads it after the thread has terminated, so the
+            # synchronization of a Queue would be wasted on it.
+            self._coverage_data = None
 
         thread_init(self, *args, **kwargs)
 
@@ -64,15 +70,17 @@ class CoverageCollectingThread(threading.Thread):
                     log.warning("Could not pickle coverage data, not injecting coverage")
                     return
                 self._coverage_context.__exit__()
-                self._coverage_queue.put(covered_lines)
+                self._coverage_data = covered_lines
 
     def join(self, *args, **kwargs):
         """Absorb coverage data from the thread after it's joined"""
         thread_join(self, *args, **kwargs)
         if self._should_cover:
-            if self._coverage_queue.qsize():
+            covered_lines = self._coverage_data
+            if covered_lines is not None:
+                self._coverage_data = None
                 try:
-                    data = pickle.loads(self._coverage_queue.get())  # nosec: B301 -- we trust this is coverage data
+                    data = pickle.loads(covered_lines)  # nosec: B301 -- we trust this is coverage data
                     thread_covered = data.get("covered", {})
                 except pickle.UnpicklingError:
                     log.warning("Could not unpickle coverage data, not injecting coverage")
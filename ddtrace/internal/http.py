@@ -1,9 +1,30 @@
 import http.client as httplib
+from typing import Dict
+from typing import Optional
 from urllib import parse
 
 from ddtrace.internal.runtime import container
 
 
+_container_headers = None  # type: Optional[Dict[str, str]]
+
+
+def _get_container_headers():
+    # type: () -> Dict[str, str]
+    """Return the memoized container info headers.
+
+    The container info and the external environment are fixed for the
+    lifetime of the process, so they are resolved once instead of on every
+    outbound request.
+    """
+    global _container_headers
+    if _container_headers is None:
+        headers = {}  # type: Dict[str, str]
+        container.update_headers(headers)
+        _container_headers = headers
+    return _container_headers
+
+
 class HTTPConnectionMixin:
     """
     Mixin for HTTP(S) connections for performing internal adjustments.
@@ -17,7 +38,11 @@ class HTTPConnectionMixin:
 
     def putrequest(self, method, url, skip_host=False, skip_accept_encoding=False):
         # type: (str, str, bool, bool) -> None
-        url = parse.urljoin(self._base_path, url)
+        base_path = self._base_path
+        if base_path != "/" or not url.startswith("/"):
+            # DEV: with the default base path an absolute URL joins to itself,
+            # so the URL parsing can be skipped entirely
+            url = parse.urljoin(base_path, url)
         return super().putrequest(  # type: ignore[misc]
             method, url, skip_host=skip_host, skip_accept_encoding=skip_accept_encoding
         )
@@ -30,9 +55,7 @@ class HTTPConnectionMixin:
         return obj
 
     def request(self, method, url, body=None, headers={}, *, encode_chunked=False):
-        _headers = headers.copy()
-
-        container.update_headers(_headers)
+        _headers = {**headers, **_get_container_headers()}
 
         return super().request(method, url, body=body, headers=_headers, encode_chunked=encode_chunked)
 
@@ -8,6 +8,7 @@ import time
 from typing import Any  # noqa:F401
 from typing import Callable  # noqa:F401
 from typing import Optional  # noqa:F401
+from typing import Tuple  # noqa:F401
 
 
 class RateLimiter(object):
@@ -17,11 +18,12 @@ class RateLimiter(object):
 
     __slots__ = (
         "_lock",
+        "_rate_per_ns",
         "current_window_ns",
         "time_window",
         "last_update_ns",
+        "_prev_window_counts",
         "max_tokens",
-        "prev_window_rate",
         "rate_limit",
         "tokens",
         "tokens_allowed",
@@ -42,6 +44,9 @@ class RateLimiter(object):
         """
         self.rate_limit = rate_limit
         self.time_window = time_window
+        # DEV: precomputed so that the replenish step is a single multiply
+        # instead of a divide followed by a multiply
+        self._rate_per_ns = rate_limit / time_window
         self.tokens = rate_limit  # type: float
         self.max_tokens = rate_limit
 
@@ -50,7 +55,10 @@ class RateLimiter(object):
         self.current_window_ns = 0  # type: float
         self.tokens_allowed = 0
         self.tokens_total = 0
-        self.prev_window_rate = None  # type: Optional[float]
+        # DEV: the previous window is stored as its raw (allowed, total)
+        # counters; the division is deferred to the much rarer
+        # `effective_rate` read
+        self._prev_window_counts = None  # type: Optional[Tuple[int, int]]
 
         self._lock = threading.Lock()
 
@@ -80,8 +88,8 @@ class RateLimiter(object):
         # has past since last window, reset
         # DEV: We are comparing nanoseconds, so 1e9 is 1 second
         elif timestamp_ns - self.current_window_ns >= self.time_window:
-            # Store previous window's rate to average with current for `.effective_rate`
-            self.prev_window_rate = self._current_window_rate()
+            # Store previous window's counts to average with current for `.effective_rate`
+            self._prev_window_counts = (self.tokens_allowed, self.tokens_total)
             self.tokens_allowed = 0
             self.tokens_total = 0
             self.current_window_ns = timestamp_ns
@@ -92,45 +100,39 @@ class RateLimiter(object):
         self.tokens_total += 1
 
     def _is_allowed(self, timestamp_ns: int) -> bool:
+        rate_limit = self.rate_limit
+
         # Rate limit of 0 blocks everything
-        if self.rate_limit == 0:
+        if rate_limit == 0:
             return False
 
         # Negative rate limit disables rate limiting
-        elif self.rate_limit < 0:
+        elif rate_limit < 0:
             return True
 
         # Lock, we need this to be thread safe, it should be shared by all threads
         with self._lock:
-            self._replenish(timestamp_ns)
+            # Replenish the tokens based on how much time has passed since the
+            # last update, then try to take one. This is inlined to keep the
+            # critical section down to straight-line code, which is what every
+            # sampling thread serializes on.
+            tokens = self.tokens
+            max_tokens = self.max_tokens
+            if tokens != max_tokens:
+                # Add more available tokens based on how much time has passed,
+                # but ensure we do not exceed the max
+                tokens = min(max_tokens, tokens + (timestamp_ns - self.last_update_ns) * self._rate_per_ns)
+
+            # Always update the timestamp, even when the bucket was full
+            self.last_update_ns = timestamp_ns
 
-            if self.tokens >= 1:
-                self.tokens -= 1
+            if tokens >= 1:
+                self.tokens = tokens - 1
                 return True
 
+            self.tokens = tokens
             return False
 
-    def _replenish(self, timestamp_ns: int) -> None:
-        try:
-            # If we are at the max, we do not need to add any more
-            if self.tokens == self.max_tokens:
-                return
-
-            # Add more available tokens based on how much time has passed
-            # DEV: We store as nanoseconds, convert to seconds
-            elapsed = (timestamp_ns - self.last_update_ns) / self.time_window
-        finally:
-            # always update the timestamp
-            # we can't update at the beginning of the function, since if we did, our calculation for
-            # elapsed would be incorrect
-            self.last_update_ns = timestamp_ns
-
-        # Update the number of available tokens, but ensure we do not exceed the max
-        self.tokens = min(
-            self.max_tokens,
-            self.tokens + (elapsed * self.rate_limit),
-        )
-
     def _current_window_rate(self) -> float:
         # No tokens have been seen, effectively 100% sample rate
         # DEV: This is to avoid division by zero error
@@ -140,6 +142,21 @@ class RateLimiter(object):
         # Get rate of tokens allowed
         return self.tokens_allowed / self.tokens_total
 
+    @property
+    def prev_window_rate(self) -> Optional[float]:
+        """
+        Return the rate of the previous window, or :obj:`None` if no window has completed yet
+
+        :rtype: :obj:`float` | :obj:`None`
+        """
+        counts = self._prev_window_counts
+        if counts is None:
+            return None
+
+        prev_allowed, prev_total = counts
+        # An empty previous window is effectively a 100% sample rate
+        return prev_allowed / prev_total if prev_total else 1.0
+
     @property
     def effective_rate(self) -> float:
         """
@@ -149,10 +166,11 @@ class RateLimiter(object):
         :rtype: :obj:`float``
         """
         # If we have not had a previous window yet, return current rate
-        if self.prev_window_rate is None:
+        prev_window_rate = self.prev_window_rate
+        if prev_window_rate is None:
             return self._current_window_rate()
 
-        return (self._current_window_rate() + self.prev_window_rate) / 2.0
+        return (self._current_window_rate() + prev_window_rate) / 2.0
 
     def __repr__(self):
         return "{}(rate_limit={!r}, tokens={!r}, last_update_ns={!r}, effective_rate={!r})".format(
@@ -215,6 +233,12 @@ class BudgetRateLimiterWithJitter:
 
     def limit(self, f: Optional[Callable[..., Any]] = None, *args: Any, **kwargs: Any) -> Any:
         """Make rate-limited calls to a function with the given arguments."""
+        # DEV: an infinite rate never exhausts its budget, so we can skip the
+        # lock and the budget bookkeeping entirely. This keeps unlimited
+        # limiters free of cross-thread lock contention on hot paths.
+        if self.max_budget == float("inf"):
+            return f(*args, **kwargs) if f is not None else None
+
         should_call = False
         with self._lock:
             now = time.monotonic()
@@ -1,3 +1,5 @@
+import logging
+
 from ddtrace.ext.test_visibility._test_visibility_base import TestVisibilityItemId
 from ddtrace.internal import core
 from ddtrace.internal.logger import get_logger
@@ -8,6 +10,9 @@ log = get_logger(__name__)
 
 
 def _get_item_span(item_id: TestVisibilityItemId) -> Span:
-    log.debug("Getting span for item %s", item_id)
-    span: Span = core.dispatch_with_results("test_visibility.item.get_span", (item_id,)).span.value
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Getting span for item %s", item_id)
+    # DEV: get_span has a single listener returning the span, so the
+    # results-wrapping machinery of dispatch_with_results can be skipped
+    span: Span = core.dispatch_one("test_visibility.item.get_span", (item_id,))
     return span
@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 import typing as t
 from typing import NamedTuple
@@ -35,25 +36,42 @@ class InternalTestBase(ext_api.TestBase):
     @staticmethod
     @_catch_and_log_exceptions
     def stash_set(item_id, key: str, value: object):
-        log.debug("Stashing value %s for key %s in item %s", value, key, item_id)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Stashing value %s for key %s in item %s", value, key, item_id)
         core.dispatch("test_visibility.item.stash_set", (item_id, key, value))
 
     @staticmethod
     @_catch_and_log_exceptions
     def stash_get(item_id: ext_api.TestVisibilityItemId, key: str):
-        log.debug("Getting stashed value for key %s in item %s", key, item_id)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Getting stashed value for key %s in item %s", key, item_id)
         stash_value = core.dispatch_with_results("test_visibility.item.stash_get", (item_id, key)).stash_value.value
-        log.debug("Got stashed value %s for key %s in item %s", stash_value, key, item_id)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Got stashed value %s for key %s in item %s", stash_value, key, item_id)
         return stash_value
 
     @staticmethod
     @_catch_and_log_exceptions
     def stash_delete(item_id: ext_api.TestVisibilityItemId, key: str):
-        log.debug("Deleting stashed value for key %s in item %s", key, item_id)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Deleting stashed value for key %s in item %s", key, item_id)
         core.dispatch("test_visibility.item.stash_delete", (item_id, key))
 
 
 class InternalTestSession(ext_api.TestSession, EFDSessionMixin, ATRSessionMixin):
+    # Session-level configuration is immutable once the session has been
+    # discovered, and the accessors below are called repeatedly (once or more
+    # per test in the pytest plugin). Each value is resolved through the core
+    # dispatch once and then served from this cache, which is reset whenever a
+    # new session is discovered.
+    _config_cache: t.Dict[str, t.Any] = {}
+
+    @staticmethod
+    @_catch_and_log_exceptions
+    def discover(*args, **kwargs):
+        InternalTestSession._config_cache.clear()
+        ext_api.TestSession.discover(*args, **kwargs)
+
     @staticmethod
     def get_span() -> Span:
         return _get_item_span(TestSessionId())
@@ -65,68 +83,94 @@ class InternalTestSession(ext_api.TestSession, EFDSessionMixin, ATRSessionMixin)
     @staticmethod
     @_catch_and_log_exceptions
     def get_codeowners() -> t.Optional[_Codeowners]:
-        log.debug("Getting codeowners object")
+        cache = InternalTestSession._config_cache
+        if "codeowners" in cache:
+            return cache["codeowners"]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Getting codeowners object")
 
         codeowners: t.Optional[_Codeowners] = core.dispatch_with_results(
             "test_visibility.session.get_codeowners",
         ).codeowners.value
+        cache["codeowners"] = codeowners
         return codeowners
 
     @staticmethod
     @_catch_and_log_exceptions
     def get_tracer() -> t.Optional[Tracer]:
-        log.debug("Getting test session tracer")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Getting test session tracer")
         tracer: t.Optional[Tracer] = core.dispatch_with_results("test_visibility.session.get_tracer").tracer.value
-        log.debug("Got test session tracer: %s", tracer)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Got test session tracer: %s", tracer)
         return tracer
 
     @staticmethod
     @_catch_and_log_exceptions
     def get_workspace_path() -> t.Optional[Path]:
-        log.debug("Getting session workspace path")
+        cache = InternalTestSession._config_cache
+        if "workspace_path" in cache:
+            return cache["workspace_path"]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Getting session workspace path")
 
         workspace_path: Path = core.dispatch_with_results(
             "test_visibility.session.get_workspace_path"
         ).workspace_path.value
+        cache["workspace_path"] = workspace_path
         return workspace_path
 
     @staticmethod
     @_catch_and_log_exceptions
     def should_collect_coverage() -> bool:
-        log.debug("Checking if coverage should be collected for session")
+        cache = InternalTestSession._config_cache
+        if "should_collect_coverage" in cache:
+            return cache["should_collect_coverage"]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Checking if coverage should be collected for session")
 
         _should_collect_coverage = bool(
             core.dispatch_with_results("test_visibility.session.should_collect_coverage").should_collect_coverage.value
         )
-        log.debug("Coverage should be collected: %s", _should_collect_coverage)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Coverage should be collected: %s", _should_collect_coverage)
 
+        cache["should_collect_coverage"] = _should_collect_coverage
         return _should_collect_coverage
 
     @staticmethod
     @_catch_and_log_exceptions
     def is_test_skipping_enabled() -> bool:
-        log.debug("Checking if test skipping is enabled")
+        cache = InternalTestSession._config_cache
+        if "is_test_skipping_enabled" in cache:
+            return cache["is_test_skipping_enabled"]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Checking if test skipping is enabled")
 
         _is_test_skipping_enabled = bool(
             core.dispatch_with_results(
                 "test_visibility.session.is_test_skipping_enabled"
             ).is_test_skipping_enabled.value
         )
-        log.debug("Test skipping is enabled: %s", _is_test_skipping_enabled)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Test skipping is enabled: %s", _is_test_skipping_enabled)
 
+        cache["is_test_skipping_enabled"] = _is_test_skipping_enabled
         return _is_test_skipping_enabled
 
     @staticmethod
     @_catch_and_log_exceptions
     def set_covered_lines_pct(coverage_pct: float):
-        log.debug("Setting covered lines percentage for session to %s", coverage_pct)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Setting covered lines percentage for session to %s", coverage_pct)
 
         core.dispatch("test_visibility.session.set_covered_lines_pct", (coverage_pct,))
 
     @staticmethod
     @_catch_and_log_exceptions
     def get_path_codeowners(path: Path) -> t.Optional[t.List[str]]:
-        log.debug("Getting codeowners object for path %s", path)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Getting codeowners object for path %s", path)
 
         path_codeowners: t.Optional[t.List[str]] = core.dispatch_with_results(
             "test_visibility.session.get_path_codeowners", (path,)
@@ -161,7 +205,8 @@ class InternalTest(ext_api.Test, InternalTestBase, ITRMixin, EFDTestMixin, ATRTe
         exc_info: t.Optional[ext_api.TestExcInfo] = None,
         override_finish_time: t.Optional[float] = None,
     ):
-        log.debug("Finishing test with status: %s, reason: %s", status, reason)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Finishing test with status: %s, reason: %s", status, reason)
         core.dispatch(
             "test_visibility.test.finish",
             (InternalTest.FinishArgs(item_id, status, reason, exc_info, override_finish_time),),
@@ -170,27 +215,33 @@ class InternalTest(ext_api.Test, InternalTestBase, ITRMixin, EFDTestMixin, ATRTe
     @staticmethod
     @_catch_and_log_exceptions
     def is_new_test(item_id: InternalTestId) -> bool:
-        log.debug("Checking if test %s is new", item_id)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Checking if test %s is new", item_id)
         is_new = bool(core.dispatch_with_results("test_visibility.test.is_new", (item_id,)).is_new.value)
-        log.debug("Test %s is new: %s", item_id, is_new)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Test %s is new: %s", item_id, is_new)
         return is_new
 
     @staticmethod
     @_catch_and_log_exceptions
     def is_quarantined_test(item_id: InternalTestId) -> bool:
-        log.debug("Checking if test %s is quarantined", item_id)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Checking if test %s is quarantined", item_id)
         is_quarantined = bool(
             core.dispatch_with_results("test_visibility.test.is_quarantined", (item_id,)).is_quarantined.value
         )
-        log.debug("Test %s is quarantined: %s", item_id, is_quarantined)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Test %s is quarantined: %s", item_id, is_quarantined)
         return is_quarantined
 
     @staticmethod
     @_catch_and_log_exceptions
     def is_disabled_test(item_id: InternalTestId) -> bool:
-        log.debug("Checking if test %s is disabled", item_id)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Checking if test %s is disabled", item_id)
         is_disabled = bool(core.dispatch_with_results("test_visibility.test.is_disabled", (item_id,)).is_disabled.value)
-        log.debug("Test %s is disabled: %s", item_id, is_disabled)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Test %s is disabled: %s", item_id, is_disabled)
         return is_disabled
 
     class OverwriteAttributesArgs(NamedTuple):
@@ -209,14 +260,15 @@ class InternalTest(ext_api.Test, InternalTestBase, ITRMixin, EFDTestMixin, ATRTe
         parameters: t.Optional[str] = None,
         codeowners: t.Optional[t.List[str]] = None,
     ):
-        log.debug(
-            "Overwriting attributes for test %s: name=%s" ", suite_name=%s" ", parameters=%s" ", codeowners=%s",
-            item_id,
-            name,
-            suite_name,
-            parameters,
-            codeowners,
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Overwriting attributes for test %s: name=%s" ", suite_name=%s" ", parameters=%s" ", codeowners=%s",
+                item_id,
+                name,
+                suite_name,
+                parameters,
+                codeowners,
+            )
         core.dispatch(
             "test_visibility.test.overwrite_attributes",
             (InternalTest.OverwriteAttributesArgs(item_id, name, suite_name, parameters, codeowners),),
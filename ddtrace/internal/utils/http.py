@@ -252,10 +252,9 @@ class Response(object):
                 log.debug("Empty reply from Datadog Agent, %r", self)
                 return
 
-            if not isinstance(body, str) and hasattr(body, "decode"):
-                body = body.decode("utf-8")
-
-            if hasattr(body, "startswith") and body.startswith("OK"):
+            # DEV: loads() accepts bytes directly, so the body does not need
+            # to be decoded into an intermediate str copy before parsing
+            if hasattr(body, "startswith") and body.startswith(b"OK" if isinstance(body, bytes) else "OK"):
                 # This typically happens when using a priority-sampling enabled
                 # library with an outdated agent. It still works, but priority sampling
                 # will probably send too many traces, so the next step is to upgrade agent.
@@ -14,6 +14,13 @@ from typing import cast
 from ddtrace.internal.safety import _isinstance
 
 
+@lru_cache(maxsize=None)
+def resolved_path(filename: str) -> Path:
+    # Resolving a path performs syscalls (getcwd, readlink) so we cache the
+    # result keyed on the (interned) code file name.
+    return Path(filename).resolve()
+
+
 @singledispatch
 def linenos(_) -> Set[int]:
     raise NotImplementedError()
@@ -37,12 +44,18 @@ def undecorated(f: FunctionType, name: str, path: Path) -> FunctionType:
     # to find the function as soon as possible.
 
     def match(g):
-        return g.__code__.co_name == name and Path(g.__code__.co_filename).resolve() == path
+        # DEV: the name check filters out most candidates before any path
+        # resolution work is done
+        code = g.__code__
+        return code.co_name == name and resolved_path(code.co_filename) == path
 
-    if _isinstance(f, FunctionType) and match(f):
+    if type(f) is FunctionType and match(f):
         return f
 
-    seen_functions = {f}
+    # DEV: track seen functions by id() to avoid hashing function objects;
+    # the objects themselves are kept alive by the object graph of f while we
+    # walk it.
+    seen_functions = {id(f)}
     q = deque([f])  # FIFO: use popleft and append
 
     while q:
@@ -53,11 +66,11 @@ def undecorated(f: FunctionType, name: str, path: Path) -> FunctionType:
         for attr in ("__wrapped__", "func"):
             try:
                 wrapped = object.__getattribute__(g, attr)
-                if _isinstance(wrapped, FunctionType) and wrapped not in seen_functions:
+                if type(wrapped) is FunctionType and id(wrapped) not in seen_functions:
                     if match(wrapped):
                         return wrapped
                     q.append(wrapped)
-                    seen_functions.add(wrapped)
+                    seen_functions.add(id(wrapped))
             except AttributeError:
                 pass
 
@@ -69,39 +82,41 @@ def undecorated(f: FunctionType, name: str, path: Path) -> FunctionType:
             if match(p.func):
                 return cast(FunctionType, p.func)
             for arg in p.args:
-                if _isinstance(arg, FunctionType) and arg not in seen_functions:
+                if type(arg) is FunctionType and id(arg) not in seen_functions:
                     if match(arg):
                         return arg
                     q.append(arg)
-                    seen_functions.add(arg)
+                    seen_functions.add(id(arg))
             for arg in p.keywords.values():
-                if _isinstance(arg, FunctionType) and arg not in seen_functions:
+                if type(arg) is FunctionType and id(arg) not in seen_functions:
                     if match(arg):
                         return arg
                     q.append(arg)
-                    seen_functions.add(arg)
+                    seen_functions.add(id(arg))
 
         # Look for a closure (function decoration)
-        if _isinstance(g, FunctionType):
-            for c in (_.cell_contents for _ in (g.__closure__ or []) if _isinstance(_.cell_contents, FunctionType)):
-                if c not in seen_functions:
+        # DEV: FunctionType cannot be subclassed so an exact type check is
+        # equivalent to (and much cheaper than) the safe isinstance here
+        if type(g) is FunctionType:
+            for c in (_.cell_contents for _ in (g.__closure__ or []) if type(_.cell_contents) is FunctionType):
+                if id(c) not in seen_functions:
                     if match(c):
                         return c
                     q.append(c)
-                    seen_functions.add(c)
+                    seen_functions.add(id(c))
 
         # Look for a function attribute (method decoration)
         # DEV: We don't recurse over arbitrary objects. We stop at the first
         # depth level.
         try:
             for v in object.__getattribute__(g, "__dict__").values():
-                if _isinstance(v, FunctionType) and v not in seen_functions and match(v):
+                if type(v) is FunctionType and id(v) not in seen_functions and match(v):
                     return v
         except AttributeError:
             # Maybe we have slots
             try:
                 for v in (object.__getattribute__(g, _) for _ in object.__getattribute__(g, "__slots__")):
-                    if _isinstance(v, FunctionType) and v not in seen_functions and match(v):
+                    if type(v) is FunctionType and id(v) not in seen_functions and match(v):
                         return v
             except AttributeError:
                 pass
@@ -109,7 +124,7 @@ def undecorated(f: FunctionType, name: str, path: Path) -> FunctionType:
         # Last resort
         try:
             for v in (object.__getattribute__(g, a) for a in object.__dir__(g)):
-                if _isinstance(v, FunctionType) and v not in seen_functions and match(v):
+                if type(v) is FunctionType and id(v) not in seen_functions and match(v):
                     return v
         except AttributeError:
             pass
@@ -1,7 +1,6 @@
 import json
 from typing import Any
 from typing import Dict
-from typing import Iterable
 from typing import List
 from typing import Optional
 from urllib.parse import urlparse
@@ -27,6 +26,10 @@ API_KEY = "anthropic.request.api_key"
 MODEL = "anthropic.request.model"
 DEFAULT_ANTHROPIC_HOSTNAME = "api.anthropic.com"
 
+USAGE_INPUT_TOKENS = "anthropic.response.usage.input_tokens"
+USAGE_OUTPUT_TOKENS = "anthropic.response.usage.output_tokens"
+USAGE_TOTAL_TOKENS = "anthropic.response.usage.total_tokens"
+
 
 class AnthropicIntegration(BaseLLMIntegration):
     _integration_name = "anthropic"
@@ -85,12 +88,16 @@ class AnthropicIntegration(BaseLLMIntegration):
         """Extract input messages from the stored prompt.
         Anthropic allows for messages and multiple texts in a message, which requires some special casing.
         """
-        if not isinstance(messages, Iterable):
+        if not isinstance(messages, (list, tuple)):
+            # DEV: an Iterable check would let strings and dicts through and
+            # fail further down, one message (or character) at a time
             log.warning("Anthropic input must be a list of messages.")
+            return []
 
-        input_messages = []
+        input_messages: List[Dict[str, Any]] = []
+        append = input_messages.append  # DEV: bound once for the block loops below
         if system_prompt is not None:
-            input_messages.append({"content": system_prompt, "role": "system"})
+            append({"content": system_prompt, "role": "system"})
         for message in messages:
             if not isinstance(message, dict):
                 log.warning("Anthropic message input must be a list of message param dicts.")
@@ -103,18 +110,20 @@ class AnthropicIntegration(BaseLLMIntegration):
                 log.warning("Anthropic input message must have content and role.")
 
             if isinstance(content, str):
-                input_messages.append({"content": content, "role": role})
+                append({"content": content, "role": role})
 
             elif isinstance(content, list):
                 for block in content:
-                    if _get_attr(block, "type", None) == "text":
-                        input_messages.append({"content": _get_attr(block, "text", ""), "role": role})
+                    # DEV: resolve the block type once instead of per elif arm
+                    block_type = _get_attr(block, "type", None)
+                    if block_type == "text":
+                        append({"content": _get_attr(block, "text", ""), "role": role})
 
-                    elif _get_attr(block, "type", None) == "image":
+                    elif block_type == "image":
                         # Store a placeholder for potentially enormous binary image data.
-                        input_messages.append({"content": "([IMAGE DETECTED])", "role": role})
+                        append({"content": "([IMAGE DETECTED])", "role": role})
 
-                    elif _get_attr(block, "type", None) == "tool_use":
+                    elif block_type == "tool_use":
                         text = _get_attr(block, "text", None)
                         input_data = _get_attr(block, "input", "")
                         if isinstance(input_data, str):
@@ -123,26 +132,27 @@ class AnthropicIntegration(BaseLLMIntegration):
                             "name": _get_attr(block, "name", ""),
                             "arguments": input_data,
                             "tool_id": _get_attr(block, "id", ""),
-                            "type": _get_attr(block, "type", ""),
+                            "type": block_type,
                         }
                         if text is None:
                             text = ""
-                        input_messages.append({"content": text, "role": role, "tool_calls": [tool_call_info]})
+                        append({"content": text, "role": role, "tool_calls": [tool_call_info]})
 
-                    elif _get_attr(block, "type", None) == "tool_result":
+                    elif block_type == "tool_result":
                         content = _get_attr(block, "content", None)
                         if isinstance(content, str):
-                            input_messages.append({"content": "[tool result: {}]".format(content), "role": role})
+                            append({"content": "[tool result: {}]".format(content), "role": role})
                         elif isinstance(content, list):
-                            input_messages.append({"content": [], "role": role})
+                            tool_result_content: List[str] = []
+                            append({"content": tool_result_content, "role": role})
                             for tool_result_block in content:
                                 if _get_attr(tool_result_block, "text", "") != "":
-                                    input_messages[-1]["content"].append(_get_attr(tool_result_block, "text", ""))
+                                    tool_result_content.append(_get_attr(tool_result_block, "text", ""))
                                 elif _get_attr(tool_result_block, "type", None) == "image":
                                     # Store a placeholder for potentially enormous binary image data.
-                                    input_messages[-1]["content"].append("([IMAGE DETECTED])")
+                                    tool_result_content.append("([IMAGE DETECTED])")
                     else:
-                        input_messages.append({"content": str(block), "role": role})
+                        append({"content": str(block), "role": role})
 
         return input_messages
 
@@ -183,11 +193,11 @@ class AnthropicIntegration(BaseLLMIntegration):
         output_tokens = _get_attr(usage, "output_tokens", None)
 
         if input_tokens is not None:
-            span.set_metric("anthropic.response.usage.input_tokens", input_tokens)
+            span.set_metric(USAGE_INPUT_TOKENS, input_tokens)
         if output_tokens is not None:
-            span.set_metric("anthropic.response.usage.output_tokens", output_tokens)
+            span.set_metric(USAGE_OUTPUT_TOKENS, output_tokens)
         if input_tokens is not None and output_tokens is not None:
-            span.set_metric("anthropic.response.usage.total_tokens", input_tokens + output_tokens)
+            span.set_metric(USAGE_TOTAL_TOKENS, input_tokens + output_tokens)
 
     def is_default_base_url(self, base_url: Optional[str] = None) -> bool:
         if base_url is None:
@@ -1,4 +1,5 @@
 import re
+from typing import Dict
 from typing import Optional
 from typing import Tuple
 from typing import Union
@@ -135,20 +136,39 @@ def extract_message_from_part_google(part, role=None):
     return message
 
 
+# Formatted usage metric keys per integration name, built once instead of
+# re-interpolating five strings for every finished LLM span
+_USAGE_METRIC_KEYS: Dict[str, Tuple[str, str, str, str, str]] = {}
+
+
+def _get_usage_metric_keys(integration_name):
+    keys = _USAGE_METRIC_KEYS.get(integration_name)
+    if keys is None:
+        keys = _USAGE_METRIC_KEYS[integration_name] = (
+            "%s.response.usage.prompt_tokens" % integration_name,
+            "%s.response.usage.input_tokens" % integration_name,
+            "%s.response.usage.completion_tokens" % integration_name,
+            "%s.response.usage.output_tokens" % integration_name,
+            "%s.response.usage.total_tokens" % integration_name,
+        )
+    return keys
+
+
 def get_llmobs_metrics_tags(integration_name, span):
     usage = {}
 
+    prompt_key, input_key, completion_key, output_key, total_key = _get_usage_metric_keys(integration_name)
+    # DEV: the metrics dict is the actual storage behind span.get_metric; one
+    # attribute resolution replaces five method dispatches
+    metrics = span._metrics
+
     # check for both prompt / completion or input / output tokens
-    input_tokens = span.get_metric("%s.response.usage.prompt_tokens" % integration_name) or span.get_metric(
-        "%s.response.usage.input_tokens" % integration_name
-    )
-    output_tokens = span.get_metric("%s.response.usage.completion_tokens" % integration_name) or span.get_metric(
-        "%s.response.usage.output_tokens" % integration_name
-    )
+    input_tokens = metrics.get(prompt_key) or metrics.get(input_key)
+    output_tokens = metrics.get(completion_key) or metrics.get(output_key)
     total_tokens = None
     if input_tokens and output_tokens:
         total_tokens = input_tokens + output_tokens
-    total_tokens = span.get_metric("%s.response.usage.total_tokens" % integration_name) or total_tokens
+    total_tokens = metrics.get(total_key) or total_tokens
 
     if input_tokens is not None:
         usage[INPUT_TOKENS_METRIC_KEY] = input_tokens
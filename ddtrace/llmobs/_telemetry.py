@@ -33,28 +33,34 @@ class LLMObsTelemetryMetrics:
     ACTIVATE_HEADERS = "activate_distributed_headers"
 
 
+# Boolean tag values, indexed by the boolean itself to avoid going through
+# str(int(...)) for every flag on the span hot paths
+_BOOL_STR = ("0", "1")
+
+_INTEGRATION_PREFIX = "integration:"
+_INTEGRATION_PREFIX_LEN = len(_INTEGRATION_PREFIX)
+
+
 def _find_integration_from_tags(tags):
-    integration_tag = next((tag for tag in tags if tag.startswith("integration:")), None)
-    if not integration_tag:
-        return None
-    return integration_tag.split("integration:")[-1]
+    for tag in tags:
+        if tag.startswith(_INTEGRATION_PREFIX):
+            return tag[_INTEGRATION_PREFIX_LEN:]
+    return None
 
 
 def _get_tags_from_span_event(event: LLMObsSpanEvent):
     span_kind = event.get("meta", {}).get("span.kind", "")
     integration = _find_integration_from_tags(event.get("tags", []))
-    autoinstrumented = integration is not None
-    error = event.get("status") == "error"
-    return [
+    return (
         ("span_kind", span_kind),
-        ("autoinstrumented", str(int(autoinstrumented))),
-        ("error", str(int(error))),
+        ("autoinstrumented", _BOOL_STR[integration is not None]),
+        ("error", _BOOL_STR[event.get("status") == "error"]),
         ("integration", integration if integration else "N/A"),
-    ]
+    )
 
 
 def _base_tags(error: Optional[str]):
-    tags = [("error", "1" if error else "0")]
+    tags = [("error", _BOOL_STR[bool(error)])]
     if error:
         tags.append(("error_type", error))
     return tags
@@ -62,7 +68,7 @@ def _base_tags(error: Optional[str]):
 
 def record_llmobs_enabled(error: Optional[str], agentless_enabled: bool, site: str, start_ns: int, auto: bool):
     tags = _base_tags(error)
-    tags.extend([("agentless", str(int(agentless_enabled))), ("site", site), ("auto", str(int(auto)))])
+    tags.extend([("agentless", _BOOL_STR[agentless_enabled]), ("site", site), ("auto", _BOOL_STR[auto])])
     init_time_ms = (time.time_ns() - start_ns) / 1e6
     telemetry_writer.add_distribution_metric(
         namespace=TELEMETRY_NAMESPACE.MLOBS, name=LLMObsTelemetryMetrics.INIT_TIME, value=init_time_ms, tags=tuple(tags)
@@ -87,37 +93,38 @@ def record_span_created(span: Span):
     span_kind = span._get_ctx_item(SPAN_KIND)
     model_provider = span._get_ctx_item("model_provider")
 
-    tags = [
-        ("autoinstrumented", str(int(autoinstrumented))),
-        ("has_session_id", str(int(has_session_id))),
-        ("is_root_span", str(int(is_root_span))),
+    tags = (
+        ("autoinstrumented", _BOOL_STR[autoinstrumented]),
+        ("has_session_id", _BOOL_STR[has_session_id]),
+        ("is_root_span", _BOOL_STR[is_root_span]),
         ("span_kind", span_kind or "N/A"),
         ("integration", integration or "N/A"),
         ("error", str(span.error)),
-    ]
+    )
     if not autoinstrumented:
-        tags.append(("decorator", str(int(decorator))))
+        tags += (("decorator", _BOOL_STR[decorator]),)
     if model_provider:
-        tags.append(("model_provider", model_provider))
+        tags += (("model_provider", model_provider),)
     telemetry_writer.add_count_metric(
-        namespace=TELEMETRY_NAMESPACE.MLOBS, name=LLMObsTelemetryMetrics.SPAN_FINISHED, value=1, tags=tuple(tags)
+        namespace=TELEMETRY_NAMESPACE.MLOBS, name=LLMObsTelemetryMetrics.SPAN_FINISHED, value=1, tags=tags
     )
 
 
-def record_span_event_raw_size(event: LLMObsSpanEvent, raw_event_size: int):
+def record_span_event_sizes(event: LLMObsSpanEvent, raw_event_size: int, event_size: int, truncated: bool):
+    # DEV: both size metrics share the same span event tags, so they are
+    # extracted once per event
+    tags = _get_tags_from_span_event(event)
     telemetry_writer.add_distribution_metric(
         namespace=TELEMETRY_NAMESPACE.MLOBS,
         name=LLMObsTelemetryMetrics.RAW_SPAN_SIZE,
         value=raw_event_size,
-        tags=tuple(_get_tags_from_span_event(event)),
+        tags=tags,
     )
-
-
-def record_span_event_size(event: LLMObsSpanEvent, event_size: int, truncated: bool):
-    tags = _get_tags_from_span_event(event)
-    tags.append(("truncated", str(int(truncated))))
     telemetry_writer.add_distribution_metric(
-        namespace=TELEMETRY_NAMESPACE.MLOBS, name=LLMObsTelemetryMetrics.SPAN_SIZE, value=event_size, tags=tuple(tags)
+        namespace=TELEMETRY_NAMESPACE.MLOBS,
+        name=LLMObsTelemetryMetrics.SPAN_SIZE,
+        value=event_size,
+        tags=tags + (("truncated", _BOOL_STR[truncated]),),
     )
 
 
@@ -147,7 +154,7 @@ def record_llmobs_annotate(span: Optional[Span], error: Optional[str]):
     is_root_span = "0"
     if span and isinstance(span, Span):
         span_kind = span._get_ctx_item(SPAN_KIND) or "N/A"
-        is_root_span = str(int(span._get_ctx_item(PARENT_ID_KEY) != ROOT_PARENT_ID))
+        is_root_span = _BOOL_STR[span._get_ctx_item(PARENT_ID_KEY) != ROOT_PARENT_ID]
     tags.extend([("span_kind", span_kind), ("is_root_span", is_root_span)])
     telemetry_writer.add_count_metric(
         namespace=TELEMETRY_NAMESPACE.MLOBS, name=LLMObsTelemetryMetrics.ANNOTATIONS, value=1, tags=tuple(tags)
@@ -156,7 +163,7 @@ def record_llmobs_annotate(span: Optional[Span], error: Optional[str]):
 
 def record_llmobs_submit_evaluation(join_on: Dict[str, Any], metric_type: str, error: Optional[str]):
     _metric_type = metric_type if metric_type in ("categorical", "score") else "other"
-    custom_joining_key = str(int(join_on.get("tag") is not None))
+    custom_joining_key = _BOOL_STR[join_on.get("tag") is not None]
     tags = _base_tags(error)
     tags.extend([("metric_type", _metric_type), ("custom_joining_key", custom_joining_key)])
     telemetry_writer.add_count_metric(
@@ -170,7 +177,7 @@ def record_span_exported(span: Optional[Span], error: Optional[str]):
     is_root_span = "0"
     if span and isinstance(span, Span):
         span_kind = span._get_ctx_item(SPAN_KIND) or "N/A"
-        is_root_span = str(int(span._get_ctx_item(PARENT_ID_KEY) != ROOT_PARENT_ID))
+        is_root_span = _BOOL_STR[span._get_ctx_item(PARENT_ID_KEY) != ROOT_PARENT_ID]
     tags.extend([("span_kind", span_kind), ("is_root_span", is_root_span)])
     telemetry_writer.add_count_metric(
         namespace=TELEMETRY_NAMESPACE.MLOBS, name=LLMObsTelemetryMetrics.SPANS_EXPORTED, value=1, tags=tuple(tags)
@@ -20,6 +20,12 @@ from ddtrace.llmobs._constants import VERTEXAI_APM_SPAN_NAME
 from ddtrace.trace import Span
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
 log = get_logger(__name__)
 
 
@@ -36,21 +42,22 @@ def validate_prompt(prompt: dict) -> Dict[str, Union[str, dict, List[str]]]:
     if variables is not None:
         if not isinstance(variables, dict):
             raise TypeError("Prompt variables must be a dictionary.")
-        if not any(isinstance(k, str) or isinstance(v, str) for k, v in variables.items()):
-            raise TypeError("Prompt variable keys and values must be strings.")
+        for k, v in variables.items():
+            # DEV: exact type checks first since plain strings are the norm;
+            # every key and value must be a string, not just one of them as
+            # the previous any() check allowed
+            if (type(k) is not str and not isinstance(k, str)) or (type(v) is not str and not isinstance(v, str)):
+                raise TypeError("Prompt variable keys and values must be strings.")
         validated_prompt["variables"] = variables
-    if template is not None:
-        if not isinstance(template, str):
-            raise TypeError("Prompt template must be a string")
-        validated_prompt["template"] = template
-    if version is not None:
-        if not isinstance(version, str):
-            raise TypeError("Prompt version must be a string.")
-        validated_prompt["version"] = version
-    if prompt_id is not None:
-        if not isinstance(prompt_id, str):
-            raise TypeError("Prompt id must be a string.")
-        validated_prompt["id"] = prompt_id
+    for key, value, error_msg in (
+        ("template", template, "Prompt template must be a string"),
+        ("version", version, "Prompt version must be a string."),
+        ("id", prompt_id, "Prompt id must be a string."),
+    ):
+        if value is not None:
+            if type(value) is not str and not isinstance(value, str):
+                raise TypeError(error_msg)
+            validated_prompt[key] = value
     if ctx_variable_keys is not None:
         if not isinstance(ctx_variable_keys, list):
             raise TypeError("Prompt field `context_variable_keys` must be a list of strings.")
@@ -71,6 +78,8 @@ def validate_prompt(prompt: dict) -> Dict[str, Union[str, dict, List[str]]]:
 
 
 class LinkTracker:
+    __slots__ = ("_object_span_links",)
+
     def __init__(self, object_span_links=None):
         self._object_span_links = object_span_links or {}
 
@@ -88,6 +97,8 @@ class LinkTracker:
 
 
 class AnnotationContext:
+    __slots__ = ("_register_annotator", "_deregister_annotator")
+
     def __init__(self, _register_annotator, _deregister_annotator):
         self._register_annotator = _register_annotator
         self._deregister_annotator = _deregister_annotator
@@ -107,30 +118,74 @@ class AnnotationContext:
 
 def _get_attr(o: object, attr: str, default: object):
     # Convenience method to get an attribute from an object or dict
-    if isinstance(o, dict):
-        return o.get(attr, default)
+    # DEV: exact type check first as plain dicts are the most common case in the hot tagging paths
+    if type(o) is dict or isinstance(o, dict):
+        return o.get(attr, default)  # type: ignore[attr-defined]
     return getattr(o, attr, default)
 
 
+_NEAREST_LLMOBS_ANCESTOR_KEY = "_ml_obs.nearest_llmobs_ancestor"
+# Sentinel marking that the ancestor walk was already done and found nothing,
+# as opposed to not having been done yet
+_NO_LLMOBS_ANCESTOR = object()
+
+
 def _get_nearest_llmobs_ancestor(span: Span) -> Optional[Span]:
-    """Return the nearest LLMObs-type ancestor span of a given span."""
+    """Return the nearest LLMObs-type ancestor span of a given span.
+
+    The result is memoized on the span, and the walk stops at the first parent
+    that has already resolved its own ancestor, so repeated lookups on a deep
+    trace walk each parent chain at most once instead of once per call.
+    """
+    cached = span._get_ctx_item(_NEAREST_LLMOBS_ANCESTOR_KEY)
+    if cached is not None:
+        return None if cached is _NO_LLMOBS_ANCESTOR else cached
+
+    ancestor: Optional[Span] = None
     parent = span._parent
     while parent:
         if parent.span_type == SpanTypes.LLM:
-            return parent
+            ancestor = parent
+            break
+        cached = parent._get_ctx_item(_NEAREST_LLMOBS_ANCESTOR_KEY)
+        if cached is not None:
+            ancestor = None if cached is _NO_LLMOBS_ANCESTOR else cached
+            break
         parent = parent._parent
-    return None
 
+    span._set_ctx_item(_NEAREST_LLMOBS_ANCESTOR_KEY, _NO_LLMOBS_ANCESTOR if ancestor is None else ancestor)
+    return ancestor
 
-def _get_span_name(span: Span) -> str:
-    if span.name in (LANGCHAIN_APM_SPAN_NAME, GEMINI_APM_SPAN_NAME, VERTEXAI_APM_SPAN_NAME) and span.resource != "":
-        return span.resource
-    elif span.name == OPENAI_APM_SPAN_NAME and span.resource != "":
-        client_name = span.get_tag("openai.request.client") or "OpenAI"
-        return "{}.{}".format(client_name, span.resource)
+
+def _default_span_name(span: Span) -> str:
     return span._get_ctx_item(NAME) or span.name
 
 
+def _resource_span_name(span: Span) -> str:
+    return span.resource if span.resource != "" else _default_span_name(span)
+
+
+def _openai_span_name(span: Span) -> str:
+    if span.resource == "":
+        return _default_span_name(span)
+    client_name = span.get_tag("openai.request.client") or "OpenAI"
+    return "{}.{}".format(client_name, span.resource)
+
+
+# Handler dispatch by APM span name, so resolving a span name is a single
+# dict lookup instead of a branch chain over the integration constants
+_SPAN_NAME_HANDLERS = {
+    LANGCHAIN_APM_SPAN_NAME: _resource_span_name,
+    GEMINI_APM_SPAN_NAME: _resource_span_name,
+    VERTEXAI_APM_SPAN_NAME: _resource_span_name,
+    OPENAI_APM_SPAN_NAME: _openai_span_name,
+}
+
+
+def _get_span_name(span: Span) -> str:
+    return _SPAN_NAME_HANDLERS.get(span.name, _default_span_name)(span)
+
+
 def _is_evaluation_span(span: Span) -> bool:
     """
     Return whether or not a span is an evaluation span by checking the span's
@@ -187,6 +242,14 @@ def _unserializable_default_repr(obj):
         return "[Unserializable object: {}]".format(repr(obj))
 
 
+def _orjson_default(obj):
+    # orjson does not serialize tuples natively; convert them so they encode
+    # as arrays like they do with the stdlib encoder
+    if isinstance(obj, tuple):
+        return list(obj)
+    return _unserializable_default_repr(obj)
+
+
 def safe_json(obj, ensure_ascii=True):
     if isinstance(obj, str):
         return obj
@@ -194,6 +257,17 @@ def safe_json(obj, ensure_ascii=True):
         # If object is a Pydantic model, convert to JSON serializable dict first using model_dump()
         if hasattr(obj, "model_dump") and callable(obj.model_dump):
             obj = obj.model_dump()
+        if orjson is not None and not ensure_ascii:
+            # DEV: orjson is considerably faster than the stdlib encoder for
+            # the dict/list/str payloads serialized on the span hot path, but
+            # it cannot escape non-ASCII output, so it only serves callers
+            # that accept UTF-8
+            try:
+                return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                # e.g. dict keys that the stdlib encoder would skip; fall
+                # back rather than dropping the payload
+                pass
         return json.dumps(obj, ensure_ascii=ensure_ascii, skipkeys=True, default=_unserializable_default_repr)
     except Exception:
         log.error("Failed to serialize object to JSON.", exc_info=True)
@@ -82,6 +82,9 @@ class BaseLLMObsWriter(PeriodicService):
         self._intake = ""  # type: str
         self._headers = {"DD-API-KEY": self._api_key, "Content-Type": "application/json"}
         self._event_type = ""  # type: str
+        # DEV: the intake connection is kept alive across flushes to avoid a
+        # TCP + TLS handshake per flush; it is dropped and recreated on error
+        self._conn = None  # type: Union[httplib.HTTPSConnection, None]
 
     def start(self, *args, **kwargs):
         super(BaseLLMObsWriter, self).start()
@@ -116,30 +119,61 @@ class BaseLLMObsWriter(PeriodicService):
             return
 
         data = self._data(events)
-        enc_llm_events = safe_json(data)
-        conn = httplib.HTTPSConnection(self._intake, 443, timeout=self._timeout)
-        try:
-            conn.request("POST", self._endpoint, enc_llm_events, self._headers)
-            resp = conn.getresponse()
-            if resp.status >= 300:
-                logger.error(
-                    "failed to send %d LLMObs %s events to %s, got response code %d, status: %s",
-                    len(events),
-                    self._event_type,
-                    self._url,
-                    resp.status,
-                    resp.read(),
-                )
-                telemetry.record_dropped_eval_payload(events, error="http_error")
-            else:
-                logger.debug("sent %d LLMObs %s events to %s", len(events), self._event_type, self._url)
-        except Exception:
-            telemetry.record_dropped_eval_payload(events, error="connection_error")
+        # DEV: the intake accepts UTF-8 payloads, which lets safe_json take
+        # its fast serialization path; encode here since http.client would
+        # otherwise encode a str body as latin-1
+        enc_llm_events = safe_json(data, ensure_ascii=False).encode("utf-8")
+        resp = None
+        body = b""
+        # A kept-alive connection may have been closed by the intake while
+        # idle, which only surfaces on the next request, so retry once on a
+        # fresh connection before dropping the payload.
+        for attempt in range(2):
+            conn = self._conn
+            if conn is None:
+                conn = self._conn = httplib.HTTPSConnection(self._intake, 443, timeout=self._timeout)
+            try:
+                conn.request("POST", self._endpoint, enc_llm_events, self._headers)
+                resp = conn.getresponse()
+                # DEV: the body must be consumed in full before the connection
+                # can be reused for the next flush; reading it here also keeps
+                # a timeout or reset mid-read from propagating out of the
+                # periodic thread and killing the writer
+                body = resp.read()
+                break
+            except Exception:
+                self._drop_connection()
+                resp = None
+                if attempt:
+                    telemetry.record_dropped_eval_payload(events, error="connection_error")
+                    logger.error(
+                        "failed to send %d LLMObs %s events to %s",
+                        len(events),
+                        self._event_type,
+                        self._intake,
+                        exc_info=True,
+                    )
+                    return
+        if resp.status >= 300:
             logger.error(
-                "failed to send %d LLMObs %s events to %s", len(events), self._event_type, self._intake, exc_info=True
+                "failed to send %d LLMObs %s events to %s, got response code %d, status: %s",
+                len(events),
+                self._event_type,
+                self._url,
+                resp.status,
+                body,
             )
-        finally:
-            conn.close()
+            telemetry.record_dropped_eval_payload(events, error="http_error")
+        else:
+            logger.debug("sent %d LLMObs %s events to %s", len(events), self._event_type, self._url)
+
+    def _drop_connection(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:  # nosec
+                pass
 
     @property
     def _url(self) -> str:
@@ -204,7 +238,8 @@ class LLMObsSpanEncoder(BufferedEncoder):
                 telemetry.record_dropped_span_payload(events, error="buffer_full")
                 return
             self._buffer.extend(events)
-            self.buffer_size += len(safe_json(events))
+            # DEV: the buffer limits are on wire bytes, not characters
+            self.buffer_size += len(safe_json(events, ensure_ascii=False).encode("utf-8"))
 
     def encode(self):
         with self._lock:
@@ -214,7 +249,9 @@ class LLMObsSpanEncoder(BufferedEncoder):
             self._init_buffer()
         data = {"_dd.stage": "raw", "_dd.tracer_version": ddtrace.__version__, "event_type": "span", "spans": events}
         try:
-            enc_llm_events = safe_json(data)
+            # DEV: HTTPWriter._put expects an encoded payload, so hand it
+            # UTF-8 bytes rather than a str
+            enc_llm_events = safe_json(data, ensure_ascii=False).encode("utf-8")
             logger.debug("encode %d LLMObs span events to be sent", len(events))
         except TypeError:
             logger.error("failed to encode %d LLMObs span events", len(events), exc_info=True)
@@ -288,7 +325,7 @@ class LLMObsSpanWriter(HTTPWriter):
             super(LLMObsSpanWriter, self).stop(timeout=timeout)
 
     def enqueue(self, event: LLMObsSpanEvent) -> None:
-        raw_event_size = len(safe_json(event))
+        raw_event_size = len(safe_json(event, ensure_ascii=False).encode("utf-8"))
         should_truncate = raw_event_size >= EVP_EVENT_SIZE_LIMIT
 
         if should_truncate:
@@ -305,8 +342,7 @@ class LLMObsSpanWriter(HTTPWriter):
                         logger.debug("flushing queue because queuing next event will exceed EVP payload limit")
                         self._flush_queue_with_client(client)
 
-        telemetry.record_span_event_raw_size(event, raw_event_size)
-        telemetry.record_span_event_size(event, len(event), should_truncate)
+        telemetry.record_span_event_sizes(event, raw_event_size, len(event), should_truncate)
         self.write([event])
 
     # Noop to make it compatible with HTTPWriter interface
@@ -3,6 +3,7 @@ import os.path
 from platform import machine
 from platform import system
 import sys
+from typing import Dict
 from typing import List
 from typing import Optional
 
@@ -32,11 +33,17 @@ def _validate_percentage(r: float) -> None:
 
 
 def _parse_options(options: List[str]):
+    # Precompute a prefix -> option index once so each parse is a single dict
+    # lookup instead of a startswith scan; the parser also runs on the remote
+    # config update path. First match wins on shared prefixes, as before.
+    index: Dict[str, str] = {}
+    for option in options:
+        for i in range(len(option) + 1):
+            index.setdefault(option[:i], option)
+    default = options[0]
+
     def parse(str_in: str) -> str:
-        for o in options:
-            if o.startswith(str_in.lower()):
-                return o
-        return options[0]
+        return index.get(str_in.lower(), default)
 
     return parse
 
@@ -46,10 +53,11 @@ def build_libddwaf_filename() -> str:
     Build the filename of the libddwaf library to load.
     """
     _DIRNAME = os.path.dirname(os.path.dirname(__file__))
-    FILE_EXTENSION = {"Linux": "so", "Darwin": "dylib", "Windows": "dll"}[system()]
+    _SYSTEM = system()
+    FILE_EXTENSION = {"Linux": "so", "Darwin": "dylib", "Windows": "dll"}[_SYSTEM]
     ARCHI = machine().lower()
     # 32-bit-Python on 64-bit-Windows
-    if system() == "Windows" and ARCHI == "amd64":
+    if _SYSTEM == "Windows" and ARCHI == "amd64":
         from sys import maxsize
 
         if maxsize <= (1 << 32):
@@ -167,49 +175,53 @@ class ASMConfig(DDConfig):
     _django_include_user_realname = DDConfig.var(bool, "DD_DJANGO_INCLUDE_USER_REALNAME", default=False)
 
     # for tests purposes
-    _asm_config_keys = [
-        "_asm_enabled",
-        "_asm_can_be_enabled",
-        "_asm_static_rule_file",
-        "_asm_obfuscation_parameter_key_regexp",
-        "_asm_obfuscation_parameter_value_regexp",
-        "_apm_tracing_enabled",
-        "_iast_enabled",
-        "_iast_request_sampling",
-        "_iast_debug",
-        "_iast_propagation_debug",
-        "_iast_telemetry_report_lvl",
-        "_ep_enabled",
-        "_use_metastruct_for_triggers",
-        "_auto_user_instrumentation_local_mode",
-        "_auto_user_instrumentation_rc_mode",
-        "_auto_user_instrumentation_enabled",
-        "_user_model_login_field",
-        "_user_model_email_field",
-        "_user_model_name_field",
-        "_api_security_enabled",
-        "_api_security_sample_delay",
-        "_api_security_parse_response_body",
-        "_waf_timeout",
-        "_iast_redaction_enabled",
-        "_iast_redaction_name_pattern",
-        "_iast_redaction_value_pattern",
-        "_iast_max_concurrent_requests",
-        "_iast_max_vulnerabilities_per_requests",
-        "_iast_lazy_taint",
-        "_iast_deduplication_enabled",
-        "_ep_stack_trace_enabled",
-        "_ep_max_stack_traces",
-        "_ep_max_stack_trace_depth",
-        "_ep_stack_top_percent",
-        "_iast_stack_trace_enabled",
-        "_asm_config_keys",
-        "_asm_deduplication_enabled",
-        "_django_include_user_name",
-        "_django_include_user_email",
-        "_django_include_user_login",
-        "_django_include_user_realname",
-    ]
+    # DEV: a frozenset so membership checks when snapshotting/restoring the
+    # config are O(1); no consumer depends on ordering
+    _asm_config_keys = frozenset(
+        {
+            "_asm_enabled",
+            "_asm_can_be_enabled",
+            "_asm_static_rule_file",
+            "_asm_obfuscation_parameter_key_regexp",
+            "_asm_obfuscation_parameter_value_regexp",
+            "_apm_tracing_enabled",
+            "_iast_enabled",
+            "_iast_request_sampling",
+            "_iast_debug",
+            "_iast_propagation_debug",
+            "_iast_telemetry_report_lvl",
+            "_ep_enabled",
+            "_use_metastruct_for_triggers",
+            "_auto_user_instrumentation_local_mode",
+            "_auto_user_instrumentation_rc_mode",
+            "_auto_user_instrumentation_enabled",
+            "_user_model_login_field",
+            "_user_model_email_field",
+            "_user_model_name_field",
+            "_api_security_enabled",
+            "_api_security_sample_delay",
+            "_api_security_parse_response_body",
+            "_waf_timeout",
+            "_iast_redaction_enabled",
+            "_iast_redaction_name_pattern",
+            "_iast_redaction_value_pattern",
+            "_iast_max_concurrent_requests",
+            "_iast_max_vulnerabilities_per_requests",
+            "_iast_lazy_taint",
+            "_iast_deduplication_enabled",
+            "_ep_stack_trace_enabled",
+            "_ep_max_stack_traces",
+            "_ep_max_stack_trace_depth",
+            "_ep_stack_top_percent",
+            "_iast_stack_trace_enabled",
+            "_asm_config_keys",
+            "_asm_deduplication_enabled",
+            "_django_include_user_name",
+            "_django_include_user_email",
+            "_django_include_user_login",
+            "_django_include_user_realname",
+        }
+    )
     _iast_redaction_numeral_pattern = DDConfig.var(
         str,
         IAST.REDACTION_VALUE_NUMERAL,
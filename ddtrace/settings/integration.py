@@ -6,6 +6,11 @@ from ..internal.utils.attrdict import AttrDict
 from .http import HttpConfig
 
 
+# The env var is immutable within a process, so it is parsed once here instead
+# of on every integration instantiation (including every .copy())
+_DEFAULT_HTTP_TAG_QUERY_STRING = os.getenv("DD_HTTP_SERVER_TAG_QUERY_STRING", "true").lower() not in ("false", "0")
+
+
 class IntegrationConfig(AttrDict):
     """
     Integration specific configuration object.
@@ -42,13 +47,11 @@ class IntegrationConfig(AttrDict):
         # TODO(munir): Remove all references to analytics_enabled and analytics_sample_rate
         self.setdefault("analytics_enabled", False)
         self.setdefault("analytics_sample_rate", 1.0)
-        service = os.getenv(
-            "DD_%s_SERVICE" % name.upper(),
-            default=os.getenv(
-                "DD_%s_SERVICE_NAME" % name.upper(),
-                default=None,
-            ),
-        )
+        # DEV: this also runs for every .copy(), so resolve the uppercased
+        # name and the environ dict once
+        env = os.environ
+        upper_name = name.upper()
+        service = env.get("DD_%s_SERVICE" % upper_name, env.get("DD_%s_SERVICE_NAME" % upper_name))
         self.setdefault("service", service)
         # TODO[v1.0]: this is required for backwards compatibility since some
         # integrations use service_name instead of service. These should be
@@ -63,9 +66,10 @@ class IntegrationConfig(AttrDict):
 
     def get_http_tag_query_string(self, value):
         if self.global_config._http_tag_query_string:
-            dd_http_server_tag_query_string = value if value else os.getenv("DD_HTTP_SERVER_TAG_QUERY_STRING", "true")
-            # If invalid value, will default to True
-            return dd_http_server_tag_query_string.lower() not in ("false", "0")
+            if value:
+                # If invalid value, will default to True
+                return value.lower() not in ("false", "0")
+            return _DEFAULT_HTTP_TAG_QUERY_STRING
         return False
 
     @property
@@ -15,13 +15,12 @@ def gen_required_suites(template: dict) -> None:
     from suitespec import get_suites
 
     required_suites = template["requires_tests"]["requires"] = []
+    template_jobs = template["jobs"]
+    # DEV: suite names are dict keys so they are already unique; sorting keeps
+    # the generated job order deterministic
     for_each_testrun_needed(
         suites=sorted(
-            set(
-                n
-                for n, s in get_suites().items()
-                if not s.get("skip", False) and n.rpartition("::")[-1] in template["jobs"]
-            )
+            n for n, s in get_suites().items() if not s.get("skip", False) and n.rpartition("::")[-1] in template_jobs
         ),
         action=lambda suite: required_suites.append(suite.rpartition("::")[-1]),
         git_selections=extract_git_commit_selections(os.getenv("GIT_COMMIT_DESC", "")),
@@ -121,7 +120,11 @@ sys.path.append(str(ROOT / "scripts"))
 sys.path.append(str(ROOT / "tests"))
 
 
-with YAML(output=CONFIG_GEN_FILE) as yaml:
+# The generated file is only ever machine-consumed, so the slow round-trip
+# mode that preserves comments and formatting is not needed; the safe mode
+# uses the C loader when available.
+with YAML(typ="safe", output=CONFIG_GEN_FILE) as yaml:
+    yaml.default_flow_style = False
     LOGGER.info("Loading configuration template from %s", CONFIG_TEMPLATE_FILE)
     config = yaml.load(CONFIG_TEMPLATE_FILE)
 
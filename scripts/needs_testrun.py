@@ -8,6 +8,7 @@ import json
 import logging
 import os
 from pathlib import Path
+import re
 from subprocess import check_output
 import sys
 import typing as t
@@ -255,7 +256,10 @@ def pr_matches_patterns(patterns: t.Set[str]) -> bool:
     except Exception:
         LOGGER.error("Failed to get changed files. Assuming the PR matches for precaution.")
         return True
-    return bool([_ for p in patterns for _ in fnmatch.filter(changed_files, p)])
+    # Compile the patterns into a single alternation so the changed files are
+    # scanned once, stopping at the first match, instead of once per pattern.
+    matcher = re.compile("|".join(fnmatch.translate(p) for p in sorted(patterns))).match
+    return any(matcher(f) for f in changed_files)
 
 
 def extract_git_commit_selections(git_commit_message: str) -> t.Set[str]:
@@ -16,6 +16,10 @@ class PynamodbTest(TracerTestCase):
     TEST_SERVICE = "pynamodb"
 
     def setUp(self):
+        # DEV: patch() is guarded by the _datadog_patch flag, so only the first
+        # test of the class (and each subprocess test, which re-runs setUp in a
+        # fresh interpreter) pays the method-wrapping cost; unpatching is done
+        # once per class below.
         patch()
 
         self.conn = Connection(region="us-east-1")
@@ -24,27 +28,37 @@ class PynamodbTest(TracerTestCase):
         super(PynamodbTest, self).setUp()
         Pin._override(self.conn, tracer=self.tracer)
 
-    def tearDown(self):
-        super(PynamodbTest, self).tearDown()
+    @pytest.fixture(autouse=True, scope="class")
+    def _patch_pynamodb(self):
+        yield
         unpatch()
 
-    @mock_dynamodb
-    def test_list_tables(self):
-        dynamodb_backend.create_table("Test", hash_key_attr="content", hash_key_type="S")
-        list_result = self.conn.list_tables()
-
-        spans = self.get_spans()
-
-        assert spans
-        span = spans[0]
-
+    # DEV: start the moto backend once for the whole class instead of paying a
+    # start/stop cycle per test; per-test isolation comes from resetting the
+    # backend state below. The subprocess tests keep their own @mock_dynamodb
+    # decorator because they re-run under unittest in a fresh interpreter
+    # where pytest fixtures do not apply.
+    @pytest.fixture(autouse=True, scope="class")
+    def _mock_dynamodb(self):
+        mock = mock_dynamodb()
+        mock.start()
+        try:
+            yield
+        finally:
+            mock.stop()
+
+    @pytest.fixture(autouse=True)
+    def _reset_dynamodb_backend(self):
+        yield
+        dynamodb_backend.reset()
+
+    def _assert_pynamodb_span(self, span, operation, resource, error=0):
         assert span.name == "pynamodb.command"
         assert span.service == "pynamodb"
-        assert span.resource == "ListTables"
-        assert len(spans) == 1
+        assert span.resource == resource
         assert_is_measured(span)
         assert span.span_type == "http"
-        assert span.get_tag("aws.operation") == "ListTables"
+        assert span.get_tag("aws.operation") == operation
         assert span.get_tag("aws.region") == "us-east-1"
         assert span.get_tag("region") == "us-east-1"
         assert span.get_tag("aws.agent") == "pynamodb"
@@ -52,12 +66,23 @@ class PynamodbTest(TracerTestCase):
         assert span.get_tag("span.kind") == "client"
         assert span.get_tag("db.system") == "dynamodb"
         assert span.duration >= 0
-        assert span.error == 0
+        assert span.error == error
+
+    def test_list_tables(self):
+        dynamodb_backend.create_table("Test", hash_key_attr="content", hash_key_type="S")
+        list_result = self.conn.list_tables()
+
+        spans = self.get_spans()
+
+        assert spans
+        span = spans[0]
+
+        assert len(spans) == 1
+        self._assert_pynamodb_span(span, operation="ListTables", resource="ListTables")
 
         assert len(list_result["TableNames"]) == 1
         assert list_result["TableNames"][0] == "Test"
 
-    @mock_dynamodb
     def test_delete_table(self):
         dynamodb_backend.create_table("Test", hash_key_attr="content", hash_key_type="S")
         delete_result = self.conn.delete_table("Test")
@@ -66,26 +91,12 @@ class PynamodbTest(TracerTestCase):
         assert spans
         span = spans[0]
 
-        assert span.name == "pynamodb.command"
-        assert span.service == "pynamodb"
-        assert span.resource == "DeleteTable Test"
         assert len(spans) == 1
-        assert_is_measured(span)
-        assert span.span_type == "http"
-        assert span.get_tag("aws.operation") == "DeleteTable"
-        assert span.get_tag("aws.region") == "us-east-1"
-        assert span.get_tag("region") == "us-east-1"
-        assert span.get_tag("aws.agent") == "pynamodb"
-        assert span.get_tag("component") == "pynamodb"
-        assert span.get_tag("span.kind") == "client"
-        assert span.get_tag("db.system") == "dynamodb"
-        assert span.duration >= 0
-        assert span.error == 0
+        self._assert_pynamodb_span(span, operation="DeleteTable", resource="DeleteTable Test")
 
         assert delete_result["Table"]["TableName"] == "Test"
         assert len(self.conn.list_tables()["TableNames"]) == 0
 
-    @mock_dynamodb
     def test_scan(self):
         dynamodb_backend.create_table("Test", hash_key_attr="content", hash_key_type="S")
         scan_result = self.conn.scan("Test")
@@ -94,26 +105,12 @@ class PynamodbTest(TracerTestCase):
         assert spans
         span = spans[0]
 
-        assert span.name == "pynamodb.command"
-        assert span.service == "pynamodb"
-        assert span.resource == "Scan Test"
         assert len(spans) == 1
-        assert_is_measured(span)
-        assert span.span_type == "http"
-        assert span.get_tag("aws.operation") == "Scan"
-        assert span.get_tag("aws.region") == "us-east-1"
-        assert span.get_tag("region") == "us-east-1"
-        assert span.get_tag("aws.agent") == "pynamodb"
-        assert span.get_tag("component") == "pynamodb"
-        assert span.get_tag("span.kind") == "client"
-        assert span.get_tag("db.system") == "dynamodb"
-        assert span.duration >= 0
-        assert span.error == 0
+        self._assert_pynamodb_span(span, operation="Scan", resource="Scan Test")
 
         assert scan_result["ScannedCount"] == 0
         assert len(scan_result["Items"]) == 0
 
-    @mock_dynamodb
     def test_scan_on_error(self):
         with pytest.raises(pynamodb.exceptions.ScanError):
             self.conn.scan("OtherTable")
@@ -121,21 +118,8 @@ class PynamodbTest(TracerTestCase):
         spans = self.get_spans()
         assert spans
         span = spans[0]
-        assert span.name == "pynamodb.command"
-        assert span.service == "pynamodb"
-        assert span.resource == "Scan OtherTable"
         assert len(spans) == 1
-        assert_is_measured(span)
-        assert span.span_type == "http"
-        assert span.get_tag("aws.operation") == "Scan"
-        assert span.get_tag("aws.region") == "us-east-1"
-        assert span.get_tag("region") == "us-east-1"
-        assert span.get_tag("aws.agent") == "pynamodb"
-        assert span.get_tag("component") == "pynamodb"
-        assert span.get_tag("span.kind") == "client"
-        assert span.get_tag("db.system") == "dynamodb"
-        assert span.duration >= 0
-        assert span.error == 1
+        self._assert_pynamodb_span(span, operation="Scan", resource="Scan OtherTable", error=1)
         assert span.get_tag("error.type") != ""
 
     @TracerTestCase.run_in_subprocess(env_overrides=dict(DD_SERVICE="mysvc"))
@@ -194,20 +178,25 @@ class PynamodbTest(TracerTestCase):
         assert len(list_result["TableNames"]) == 1
         assert list_result["TableNames"][0] == "Test"
 
+    # DEV: the unspecified-service and operation checks for each schema version
+    # share the same environment, so they run in a single subprocess; the
+    # schema is bound at ddtrace import time, which is why each distinct
+    # environment still needs its own interpreter.
     @TracerTestCase.run_in_subprocess(env_overrides=dict(DD_TRACE_SPAN_ATTRIBUTE_SCHEMA="v0"))
     @mock_dynamodb
-    def test_schematized_unspecified_service_v0(self):
+    def test_schematized_unspecified_service_and_operation_v0(self):
         dynamodb_backend.create_table("Test", hash_key_attr="content", hash_key_type="S")
         list_result = self.conn.list_tables()
 
         span = self.get_spans()[0]
         assert span.service == "pynamodb", "Expected 'pynamodb', got %s" % span.service
+        assert span.name == "pynamodb.command", "Expected 'pynamodb.command', got %s" % span.name
         assert len(list_result["TableNames"]) == 1
         assert list_result["TableNames"][0] == "Test"
 
     @TracerTestCase.run_in_subprocess(env_overrides=dict(DD_TRACE_SPAN_ATTRIBUTE_SCHEMA="v1"))
     @mock_dynamodb
-    def test_schematized_unspecified_service_v1(self):
+    def test_schematized_unspecified_service_and_operation_v1(self):
         dynamodb_backend.create_table("Test", hash_key_attr="content", hash_key_type="S")
         list_result = self.conn.list_tables()
 
@@ -215,27 +204,6 @@ class PynamodbTest(TracerTestCase):
         assert span.service == DEFAULT_SPAN_SERVICE_NAME, (
             "Expected 'internal.schema.DEFAULT_SEVICE_NAME', got %s" % span.service
         )
-        assert len(list_result["TableNames"]) == 1
-        assert list_result["TableNames"][0] == "Test"
-
-    @TracerTestCase.run_in_subprocess(env_overrides=dict(DD_TRACE_SPAN_ATTRIBUTE_SCHEMA="v0"))
-    @mock_dynamodb
-    def test_schematized_operation_v0(self):
-        dynamodb_backend.create_table("Test", hash_key_attr="content", hash_key_type="S")
-        list_result = self.conn.list_tables()
-
-        span = self.get_spans()[0]
-        assert span.name == "pynamodb.command", "Expected 'pynamodb.command', got %s" % span.name
-        assert len(list_result["TableNames"]) == 1
-        assert list_result["TableNames"][0] == "Test"
-
-    @TracerTestCase.run_in_subprocess(env_overrides=dict(DD_TRACE_SPAN_ATTRIBUTE_SCHEMA="v1"))
-    @mock_dynamodb
-    def test_schematized_operation_v1(self):
-        dynamodb_backend.create_table("Test", hash_key_attr="content", hash_key_type="S")
-        list_result = self.conn.list_tables()
-
-        span = self.get_spans()[0]
         assert span.name == "aws.dynamodb.request", "Expected 'aws.dynamodb.request', got %s" % span.name
         assert len(list_result["TableNames"]) == 1
         assert list_result["TableNames"][0] == "Test"
@@ -3,6 +3,7 @@ import time
 
 import mock
 
+from ddtrace.llmobs._utils import safe_json
 from ddtrace.llmobs._writer import LLMObsSpanWriter
 from tests.llmobs._utils import _chat_completion_event
 from tests.llmobs._utils import _completion_event
@@ -56,6 +57,12 @@ def test_flush_queue_when_event_cause_queue_to_exceed_payload_limit(
 
 
 def test_truncating_oversized_events(mock_writer_logs, mock_http_writer_send_payload_response):
+    # DEV: compute the expected sizes the same way the writer does so the test
+    # does not depend on the formatting of whichever JSON serializer is in use
+    expected_sizes = [
+        len(safe_json(event, ensure_ascii=False).encode("utf-8"))
+        for event in (_oversized_llm_event(), _oversized_retrieval_event(), _oversized_workflow_event())
+    ]
     with override_global_config(dict(_dd_api_key="foobar.baz", _dd_site=DATADOG_SITE)):
         llmobs_span_writer = LLMObsSpanWriter(is_agentless=True, agentless_url=INTAKE_URL, interval=1000, timeout=1)
         llmobs_span_writer.enqueue(_oversized_llm_event())
@@ -64,14 +71,10 @@ def test_truncating_oversized_events(mock_writer_logs, mock_http_writer_send_pay
         mock_writer_logs.warning.assert_has_calls(
             [
                 mock.call(
-                    "dropping event input/output because its size (%d) exceeds the event size limit (1MB)", 1400724
-                ),
-                mock.call(
-                    "dropping event input/output because its size (%d) exceeds the event size limit (1MB)", 1400464
-                ),
-                mock.call(
-                    "dropping event input/output because its size (%d) exceeds the event size limit (1MB)", 1400445
-                ),
+                    "dropping event input/output because its size (%d) exceeds the event size limit (1MB)",
+                    expected_size,
+                )
+                for expected_size in expected_sizes
             ]
         )
 
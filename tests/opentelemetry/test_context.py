@@ -1,4 +1,6 @@
 import multiprocessing
+import os
+import sys
 import threading
 import time
 
@@ -14,25 +16,31 @@ from ddtrace.constants import MANUAL_DROP_KEY
 from ddtrace.constants import MANUAL_KEEP_KEY
 
 
+# The sleeps in these tests only exist to give the spans a visible, non-zero
+# duration in the snapshots, which do not compare exact durations; CI can dial
+# the unit down to cut the fixed wall time of this module.
+SLEEP_UNIT = float(os.environ.get("DD_TEST_SLEEP_UNIT", "0.02"))
+
+
 @pytest.mark.snapshot
 def test_otel_span_parenting(oteltracer):
     with oteltracer.start_as_current_span("otel-root") as root:
-        time.sleep(0.02)
+        time.sleep(SLEEP_UNIT)
         with oteltracer.start_as_current_span("otel-parent1"):
-            time.sleep(0.04)
+            time.sleep(2 * SLEEP_UNIT)
             with oteltracer.start_as_current_span("otel-child1"):
-                time.sleep(0.06)
+                time.sleep(3 * SLEEP_UNIT)
 
         orphan1 = oteltracer.start_span("orphan1", context=None)
 
         ctx = opentelemetry.trace.set_span_in_context(opentelemetry.trace.NonRecordingSpan(root.get_span_context()))
         with oteltracer.start_span("otel-parent2", context=ctx) as parent2:
-            time.sleep(0.04)
+            time.sleep(2 * SLEEP_UNIT)
             ctx = opentelemetry.trace.set_span_in_context(
                 opentelemetry.trace.NonRecordingSpan(parent2.get_span_context())
             )
             with oteltracer.start_as_current_span("otel-child2", context=ctx):
-                time.sleep(0.06)
+                time.sleep(3 * SLEEP_UNIT)
 
         orphan1.end()
 
@@ -41,15 +49,15 @@ def test_otel_span_parenting(oteltracer):
 def test_otel_ddtrace_mixed_parenting(oteltracer):
     with oteltracer.start_as_current_span("otel-top-level"):
         with ddtrace.tracer.trace("ddtrace-top-level"):
-            time.sleep(0.02)
+            time.sleep(SLEEP_UNIT)
             with ddtrace.tracer.trace("ddtrace-child"):
-                time.sleep(0.04)
+                time.sleep(2 * SLEEP_UNIT)
 
             with oteltracer.start_as_current_span("otel-child"):
-                time.sleep(0.02)
+                time.sleep(SLEEP_UNIT)
                 with ddtrace.tracer.trace("ddtrace-grandchild"):
                     with oteltracer.start_as_current_span("otel-grandchild"):
-                        time.sleep(0.02)
+                        time.sleep(SLEEP_UNIT)
 
 
 @pytest.mark.snapshot
@@ -58,9 +66,9 @@ def test_otel_multithreading(oteltracer):
         ctx = opentelemetry.trace.set_span_in_context(opentelemetry.trace.NonRecordingSpan(parent_context))
         with oteltracer.start_as_current_span("s1", context=ctx):
             with oteltracer.start_as_current_span("s2"):
-                time.sleep(0.02)
+                time.sleep(SLEEP_UNIT)
             with oteltracer.start_as_current_span("s3"):
-                time.sleep(0.06)
+                time.sleep(3 * SLEEP_UNIT)
 
     with oteltracer.start_span("otel-threading-root") as root:
         # Opentelemetry does not automatically propagate a span context across threads.
@@ -73,6 +81,12 @@ def test_otel_multithreading(oteltracer):
             t.join()
 
 
+# DEV: fork the child processes where the platform allows it so they inherit
+# the already-imported ddtrace and opentelemetry modules instead of paying a
+# full interpreter startup + import cycle per test under the spawn method.
+_MP_CTX = multiprocessing.get_context("spawn" if sys.platform == "win32" else "fork")
+
+
 def _subprocess_task(parent_span_context, errors):
     from ddtrace.opentelemetry import TracerProvider
 
@@ -82,7 +96,7 @@ def _subprocess_task(parent_span_context, errors):
     try:
         ctx = opentelemetry.trace.set_span_in_context(opentelemetry.trace.NonRecordingSpan(parent_span_context))
         with ot_tracer.start_as_current_span("task", context=ctx):
-            time.sleep(0.02)
+            time.sleep(SLEEP_UNIT)
     except AssertionError as e:
         errors.put(e)
     finally:
@@ -93,10 +107,10 @@ def _subprocess_task(parent_span_context, errors):
 
 @pytest.mark.snapshot(ignores=["meta.tracestate"])
 def test_otel_trace_across_fork(oteltracer):
-    errors = multiprocessing.Queue()
+    errors = _MP_CTX.Queue()
     with oteltracer.start_as_current_span("root") as root:
         oteltracer._tracer.sample(root._ddspan)
-        p = multiprocessing.Process(target=_subprocess_task, args=(root.get_span_context(), errors))
+        p = _MP_CTX.Process(target=_subprocess_task, args=(root.get_span_context(), errors))
         try:
             p.start()
         finally:
@@ -109,9 +123,9 @@ def test_otel_trace_across_fork(oteltracer):
 @pytest.mark.parametrize("decision", [MANUAL_KEEP_KEY, MANUAL_DROP_KEY], ids=["manual.keep", "manual.drop"])
 def test_sampling_decisions_across_processes(oteltracer, decision):
     # sampling decision in the subprocess task should be the same as the parent
-    errors = multiprocessing.Queue()
+    errors = _MP_CTX.Queue()
     with oteltracer.start_as_current_span("root", attributes={decision: ""}) as root:
-        p = multiprocessing.Process(target=_subprocess_task, args=(root.get_span_context(), errors))
+        p = _MP_CTX.Process(target=_subprocess_task, args=(root.get_span_context(), errors))
         try:
             p.start()
         finally:
@@ -125,7 +139,7 @@ def test_sampling_decisions_across_processes(oteltracer, decision):
 async def test_otel_trace_multiple_coroutines(oteltracer):
     async def coro(i):
         with oteltracer.start_as_current_span("corountine %s" % (i,)):
-            time.sleep(0.02)
+            time.sleep(SLEEP_UNIT)
             return 42
 
     with oteltracer.start_as_current_span("root"):